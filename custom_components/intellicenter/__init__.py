@@ -106,10 +106,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     controller = ModelController(entry.data[CONF_HOST], model, loop=hass.loop)
 
     class Handler(ConnectionHandler):
+        """Dispatch controller events to Home Assistant."""
+
         UPDATE_SIGNAL = DOMAIN + "_UPDATE_" + entry.entry_id
         CONNECTION_SIGNAL = DOMAIN + "_CONNECTION_" + entry.entry_id
 
         def started(self, controller):
+            """Set up the platforms once the controller is first connected."""
             _LOGGER.info(f"connected to system: '{controller.systemInfo.propName}'")
 
             for object in controller.model:
@@ -8,7 +8,7 @@ from homeassistant.components.cover import (
     CoverEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from . import PoolEntity
 from .const import DOMAIN
@@ -22,6 +22,10 @@ from .pyintellicenter import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# attributes whose changes affect the state of a cover entity
+# built once at module load; isUpdated runs for every push update
+_COVER_UPDATE_KEYS = frozenset({STATUS_ATTR, NORMAL_ATTR})
+
 # -------------------------------------------------------------------------------------
 
 
@@ -33,10 +37,10 @@ async def async_setup_entry(
 
     covers = []
 
+    # indexed lookup: only EXTINSTR objects are considered, not the whole model
     obj: PoolObject
-    for obj in controller.model.objectList:
-        if obj.objtype == EXTINSTR_TYPE and obj.subtype == "COVER":
-            covers.append(PoolCover(entry, controller, obj))
+    for obj in controller.model.getByType(EXTINSTR_TYPE, "COVER"):
+        covers.append(PoolCover(entry, controller, obj))
 
     async_add_entities(covers)
 
@@ -64,10 +68,12 @@ class PoolCover(PoolEntity, CoverEntity):
         self._attr_supported_features = (
             CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
         )
+        # HA reads is_closed far more often than the underlying object
+        # changes, so the state is computed once per push update
+        self._is_closed = self._computeIsClosed()
 
-    @property
-    def is_closed(self) -> bool:
-        """Return true if cover is closed."""
+    def _computeIsClosed(self) -> bool:
+        """Compute the closed state from the underlying pool object."""
         # The cover is closed if:
         # - STATUS is ON and NORMAL is ON (cover is normally closed)
         # - STATUS is OFF and NORMAL is OFF (cover is normally open)
@@ -75,6 +81,11 @@ class PoolCover(PoolEntity, CoverEntity):
         normal = self._poolObject[NORMAL_ATTR] == "ON"
         return status == normal
 
+    @property
+    def is_closed(self) -> bool:
+        """Return true if cover is closed."""
+        return self._is_closed
+
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
         # To open the cover, we need to set STATUS opposite of NORMAL
@@ -90,4 +101,19 @@ class PoolCover(PoolEntity, CoverEntity):
     def isUpdated(self, updates: dict[str, dict[str, str]]) -> bool:
         """Return true if the entity is updated by the updates from Intellicenter."""
         myUpdates = updates.get(self._poolObject.objnam, {})
-        return bool(myUpdates and ({STATUS_ATTR, NORMAL_ATTR} & myUpdates.keys()))
+        if not myUpdates or _COVER_UPDATE_KEYS.isdisjoint(myUpdates):
+            return False
+        # refresh the cached state now that a relevant attribute changed
+        self._is_closed = self._computeIsClosed()
+        return True
+
+    @callback
+    def _connection_callback(self, is_connected: bool) -> None:
+        """Recompute the cached state when the connection is restored."""
+        if is_connected:
+            # the pool object may have been replaced while disconnected
+            obj = self._controller.model[self._poolObject.objnam]
+            if obj:
+                self._poolObject = obj
+                self._is_closed = self._computeIsClosed()
+        super()._connection_callback(is_connected)
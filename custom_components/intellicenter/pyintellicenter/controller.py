@@ -22,6 +22,7 @@ with the Pentair IntelliCenter system:
 import asyncio
 from asyncio import AbstractEventLoop, Future, Transport
 from collections.abc import Callable
+from functools import lru_cache
 from hashlib import blake2b
 import logging
 import traceback
@@ -44,6 +45,16 @@ _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.INFO)
 
 
+@lru_cache(maxsize=64)
+def _unique_id_for(sname: str) -> str:
+    """Return the unique id derived from a system name.
+
+    Cached: reconnect cycles re-create SystemInfo with the same SNAME,
+    so the hash is computed once per distinct name.
+    """
+    return blake2b(sname.encode(), digest_size=8).hexdigest()
+
+
 class CommandError(Exception):
     """Represents an error in response to a Pentair request.
 
@@ -99,9 +110,7 @@ class SystemInfo:
 
         # Generate a unique ID by hashing the system name
         # This ensures a stable identifier even if IP/hostname changes
-        h = blake2b(digest_size=8)
-        h.update(params[SNAME_ATTR].encode())
-        self._unique_id: str = h.hexdigest()
+        self._unique_id: str = _unique_id_for(params[SNAME_ATTR])
 
     @property
     def propName(self) -> str:
@@ -156,15 +165,14 @@ def prune(obj: Any) -> Any:
     Returns:
         The pruned object with undefined parameters removed
     """
-    # undefined meaning key == value which is what Pentair returns
-    if type(obj) is list:
+    # undefined meaning key == value which is what Pentair returns;
+    # exact type checks are enough for JSON-decoded payloads and a
+    # comprehension avoids the per-item append on this hot path
+    cls = type(obj)
+    if cls is dict:
+        return {key: prune(value) for key, value in obj.items() if key != value}
+    if cls is list:
         return [prune(item) for item in obj]
-    elif type(obj) is dict:
-        result = {}
-        for key, value in obj.items():
-            if key != value:
-                result[key] = prune(value)
-        return result
     return obj
 
 
@@ -527,6 +535,9 @@ class ConnectionHandler:
         self._disconnectDebounceTime = disconnectDebounceTime
         self._disconnectDebounceTask = None
         self._isConnected = False
+        # set while the controller is connected; lets callers (and
+        # tests) await connection establishment instead of polling
+        self._connected_event = asyncio.Event()
 
         controller._diconnectedCallback = self._diconnectedCallback
 
@@ -543,7 +554,8 @@ class ConnectionHandler:
         if not self._starterTask:
             self._starterTask = asyncio.create_task(self._starter())
 
-    def _next_delay(self, currentDelay: int) -> int:
+    @staticmethod
+    def _next_delay(currentDelay: int) -> int:
         """Compute the delay before the next reconnection attempt.
 
         default is exponential backoff with a 1.5 factor
@@ -580,6 +592,7 @@ class ConnectionHandler:
                     if not self._isConnected:
                         self.reconnected(self._controller)
                     self._isConnected = True
+                self._connected_event.set()
 
                 started = True
                 self._starterTask = None
@@ -629,6 +642,7 @@ class ConnectionHandler:
 
             # Mark as disconnected immediately for internal tracking
             self._isConnected = False
+            self._connected_event.clear()
 
             # Schedule debounced disconnect notification
             if self._disconnectDebounceTask and not self._disconnectDebounceTask.done():
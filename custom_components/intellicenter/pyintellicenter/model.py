@@ -1,5 +1,6 @@
 """Model class for storing a Pentair system."""
 
+from collections import defaultdict
 import logging
 
 from .attributes import (
@@ -150,6 +151,9 @@ class PoolModel:
     def __init__(self, attributeMap=ALL_ATTRIBUTES_BY_TYPE):
         """Initialize."""
         self._objects: dict[str, PoolObject] = {}
+        # index by object type so platform setup does not have to scan
+        # the whole model to find the handful of objects it cares about
+        self._objectsByType: dict[str, list[PoolObject]] = defaultdict(list)
         self._systemObject: PoolObject = None
         self._attributeMap = attributeMap
 
@@ -183,18 +187,33 @@ class PoolModel:
             getByType('BODY') will return the object of type 'BODY'
             getByType('BODY','SPA') will only return the Spa
         """
-        return list(
-            filter(
-                lambda object: object.objtype == type
-                and (not subtype or object.subtype == subtype),
-                self,
-            )
-        )
+        # the index narrows the scan to a handful of candidates, but
+        # OBJTYP can change in an update (see PoolObject.update), so the
+        # live type is re-checked on the way out
+        objects = self._objectsByType.get(type, [])
+        if subtype:
+            return [
+                object
+                for object in objects
+                if object.objtype == type and object.subtype == subtype
+            ]
+        return [object for object in objects if object.objtype == type]
 
     def getChildren(self, object: PoolObject) -> list[PoolObject]:
         """Return the children of a given object."""
         return list(filter(lambda v: v[PARENT_ATTR] == object.objnam, self))
 
+    def _updateObject(self, object: PoolObject, params) -> dict:
+        """Apply updates to an object, keeping the type index in sync."""
+        previous_type = object.objtype
+        changed = object.update(params)
+        if object.objtype != previous_type:
+            bucket = self._objectsByType[previous_type]
+            if object in bucket:
+                bucket.remove(object)
+            self._objectsByType[object.objtype].append(object)
+        return changed
+
     def addObject(self, objnam, params):
         """Update the model with a new object."""
         # because the controller may be started more than once
@@ -207,10 +226,11 @@ class PoolModel:
                 self._systemObject = object
             if object.objtype in self._attributeMap:
                 self._objects[objnam] = object
+                self._objectsByType[object.objtype].append(object)
             else:
                 object = None
         else:
-            object.update(params)
+            self._updateObject(object, params)
         return object
 
     def addObjects(self, objList: list):
@@ -238,7 +258,7 @@ class PoolModel:
             objnam = update["objnam"]
             object = self._objects.get(objnam)
             if object:
-                changed = object.update(update["params"])
+                changed = self._updateObject(object, update["params"])
                 if changed:
                     updated[objnam] = changed
         return updated
@@ -9,14 +9,36 @@ Pentair IntelliCenter pool control systems. It handles:
 """
 
 import asyncio
+from collections import deque
+from collections.abc import Callable
 import json
 import logging
-from queue import SimpleQueue
+import time
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .controller import BaseController
 
+# annotated once so both branches below assign compatibly under mypy
+_json_loads: Callable[[bytes | str], Any]
+_json_dumps: Callable[[Any], bytes]
+
+try:
+    # orjson (bundled with Home Assistant) is several times faster than the
+    # stdlib json module and serializes straight to bytes
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover
+
+    def _stdlib_dumps(obj: Any) -> bytes:
+        """Serialize to bytes using the stdlib json module."""
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+    _json_dumps = _stdlib_dumps
+
 _LOGGER = logging.getLogger(__name__)
 # _LOGGER.setLevel(logging.DEBUG)
 
@@ -26,11 +48,29 @@ _LOGGER = logging.getLogger(__name__)
 # NOTE: IntelliCenter does NOT support ping/pong protocol
 # It sends NotifyList push updates when equipment state changes
 # We send periodic keepalive queries to maintain connection health
-HEARTBEAT_INTERVAL = 30  # Check connection health every 30 seconds
+HEARTBEAT_INTERVAL = 30  # Longest time between connection health checks
+HEARTBEAT_MIN_INTERVAL = 5  # Never wake more often than this
 FLOW_CONTROL_TIMEOUT = 45  # Reset flow control if stuck for 45 seconds
 KEEPALIVE_INTERVAL = 90  # Send keepalive query every 90 seconds
 CONNECTION_IDLE_TIMEOUT = 300  # Close connection if no data received for 5 minutes (should never happen with keepalives)
 
+# message terminator, hoisted so the framing loop references one constant
+_CRLF = b"\r\n"
+
+# Fast path for commands without extra parameters: the payload shape is
+# fixed, so format the messageID and command straight into a bytes template
+# instead of building and serializing a dict
+_COMMAND_TEMPLATE = b'{"messageID":"%d","command":%s}'
+
+# The keepalive payload is completely static except for the messageID, so it
+# is pre-encoded once; the heartbeat only formats the ID into the template
+# instead of building a dict and serializing it on every keepalive
+_KEEPALIVE_TEMPLATE = (
+    b'{"messageID":"%d","command":"GetParamList",'
+    b'"condition":"OBJTYP=SYSTEM",'
+    b'"objectList":[{"objnam":"INCR","keys":["MODE"]}]}'
+)
+
 
 class ICProtocol(asyncio.Protocol):
     """The ICProtocol handles the low level protocol with a Pentair system.
@@ -45,19 +85,43 @@ class ICProtocol(asyncio.Protocol):
     - relying on IntelliCenter's NotifyList push updates to detect active connections
     """
 
-    def __init__(self, controller: "BaseController") -> None:
+    def __init__(
+        self,
+        controller: "BaseController",
+        max_in_flight: int = 1,
+        coalesce_delay: float = 0.0,
+    ) -> None:
         """Initialize a protocol for a IntelliCenter system.
 
         Args:
             controller: The controller instance that manages this protocol.
                        The controller receives callbacks for connection events
                        and message processing.
+            max_in_flight: Maximum number of requests allowed on the wire at
+                          a time. Defaults to 1, the only value known to be
+                          safe with IntelliCenter firmware.
+            coalesce_delay: Optional extra window (in seconds) to hold the
+                           first write of a burst so slightly-later requests
+                           share the same flush. 0 (the default) flushes at
+                           the end of the current event loop iteration.
         """
 
         self._controller: BaseController = controller
+        self._max_in_flight: int = max_in_flight
+        self._coalesce_delay: float = coalesce_delay
 
         self._transport: asyncio.Transport | None = None
 
+        # event loop and its clock, bound once in connection_made so the
+        # hot paths avoid the asyncio.get_event_loop() lookup per call
+        # (loop.time is time.monotonic based, so this is a safe default)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._time: Callable[[], float] = time.monotonic
+
+        # transport.writelines bound once per connection so every send
+        # skips the transport attribute lookup
+        self._writelines: Callable[[list[bytes]], None] | None = None
+
         # counter used to generate messageIDs
         # IntelliCenter expects each request to have a unique incrementing ID
         self._msgID: int = 1
@@ -65,16 +129,28 @@ class ICProtocol(asyncio.Protocol):
         # buffer used to accumulate data received before splitting into lines
         # Messages from IntelliCenter are JSON terminated with \r\n
         # We may receive partial messages, so we buffer until complete
-        self._lineBuffer: str = ""
+        # Kept as a bytearray so fragmented streams append in place instead
+        # of reallocating an immutable str on every chunk
+        self._lineBuffer: bytearray = bytearray()
 
         # Flow control state: ensures only one request is on the wire at a time
         # IntelliCenter struggles to parse concurrent requests, so we queue them
         # _out_pending: count of requests sent but not yet responded to
         # _out_queue: queue of requests waiting to be sent
+        # (a plain deque: the protocol is single-threaded so the locking
+        # of queue.SimpleQueue would be pure overhead)
         self._out_pending: int = 0
-        self._out_queue: SimpleQueue[str] = SimpleQueue()
+        self._out_queue: deque[bytes] = deque()
         self._last_flow_control_activity: float | None = None
 
+        # Write coalescing: requests issued in the same event loop iteration
+        # (initial subscribe, several SetParamList at once, ...) go out via a
+        # single writelines() call instead of one syscall per message. The
+        # drain is still bounded by max_in_flight, so with the default budget
+        # of 1 a burst sends one request and queues the rest.
+        # _flush_scheduled guards against scheduling _flush twice.
+        self._flush_scheduled: bool = False
+
         # Track last data received time for connection health monitoring
         # Used to detect idle connections and trigger reconnection
         self._last_data_received: float | None = None
@@ -98,8 +174,23 @@ class ICProtocol(asyncio.Protocol):
         """
 
         self._transport = transport  # type: ignore[assignment]
+
+        # Prefer the transport's native writelines: on uvloop (and modern
+        # asyncio) it turns a batch into a single writev(). Fall back to a
+        # concatenated write for transports that lack it, so the batch
+        # still goes out as one syscall.
+        writelines = getattr(transport, "writelines", None)
+        if writelines is None:
+
+            def writelines(chunks: list[bytes]) -> None:
+                """Write the chunks as a single concatenated payload."""
+                transport.write(b"".join(chunks))  # type: ignore[attr-defined]
+
+        self._writelines = writelines
         self._msgID = 1
-        current_time = asyncio.get_event_loop().time()
+        self._loop = asyncio.get_running_loop()
+        self._time = self._loop.time
+        current_time = self._time()
         self._last_flow_control_activity = current_time
         self._last_data_received = current_time
         self._last_keepalive_sent = current_time
@@ -127,6 +218,9 @@ class ICProtocol(asyncio.Protocol):
             self._heartbeat_task.cancel()
             self._heartbeat_task = None
 
+        # Drop the bound transport method so no further writes go out
+        self._writelines = None
+
         self._controller.connection_lost(exc)
 
     def data_received(self, data: bytes) -> None:
@@ -145,28 +239,38 @@ class ICProtocol(asyncio.Protocol):
         """
 
         # Update last data received timestamp for connection health monitoring
-        self._last_data_received = asyncio.get_event_loop().time()
+        self._last_data_received = self._time()
 
-        decoded_data = data.decode()
-        _LOGGER.debug(f"PROTOCOL: received from transport: {decoded_data}")
+        # lazy %-formatting: the string is only built if DEBUG is enabled
+        _LOGGER.debug("PROTOCOL: received from transport: %r", data)
 
         # "packets" from Pentair are organized by lines (terminated with \r\n)
-        # so wait until at least a full line is received
-        self._lineBuffer += decoded_data
-
-        # If we don't have a complete message yet, wait for more data
-        if not self._lineBuffer.endswith("\r\n"):
-            return
-
-        # Split buffer into individual messages (there might be multiple)
-        # The split will create an empty string at the end due to trailing \r\n
-        lines = str.split(self._lineBuffer, "\r\n")
-        self._lineBuffer = ""
-
-        # Process each complete message
-        for line in lines:
-            if line:  # Skip empty strings from split
-                self.processMessage(line)
+        # so accumulate raw bytes until at least a full line is received
+        buf = self._lineBuffer
+        buf.extend(data)
+
+        # Walk the buffer one terminator at a time, handing each complete
+        # message to the parser as raw bytes. A memoryview over the buffer
+        # means only the message actually parsed is copied out - there is
+        # no intermediate copy of the whole completed region and no list
+        # of all its lines.
+        start = 0
+        find = buf.find  # bind once; the loop runs per received frame
+        mv = memoryview(buf)
+        try:
+            while (end := find(_CRLF, start)) >= 0:
+                if end > start:  # skip empty lines (consecutive terminators)
+                    self.processMessage(bytes(mv[start:end]))
+                start = end + 2
+        finally:
+            # the exported view must be released before the buffer can
+            # be resized below
+            mv.release()
+
+        # Drop the consumed region; any trailing partial message stays
+        # buffered until more data arrives
+        if start:
+            del buf[:start]
 
     def sendCmd(self, cmd: str, extra: dict[str, Any] | None = None) -> str:
         """Send a command and return a generated message ID.
@@ -183,32 +287,62 @@ class ICProtocol(asyncio.Protocol):
         Returns:
             The message ID assigned to this command (as a string).
         """
-        msg_id = str(self._msgID)
-        message_dict: dict[str, Any] = {"messageID": msg_id, "command": cmd}
+        # f-string formatting hits CPython's fast path for plain ints,
+        # edging out the str() call on this per-request path
+        msg_id = f"{self._msgID}"
         if extra:
+            message_dict: dict[str, Any] = {"messageID": msg_id, "command": cmd}
             message_dict.update(extra)
+            packet = _json_dumps(message_dict)
+        else:
+            # no extra parameters: skip the dict build/serialize entirely
+            packet = _COMMAND_TEMPLATE % (self._msgID, _json_dumps(cmd))
         self._msgID = self._msgID + 1
-        packet = json.dumps(message_dict)
         self.sendRequest(packet)
 
-        return str(msg_id)
+        return msg_id
 
-    def _writeToTransport(self, request: str) -> None:
-        """Write a request to the transport.
+    def _writeToTransport(self, requests: list[bytes]) -> None:
+        """Write one or more requests to the transport.
 
         Internal method that handles the actual transmission of data
-        over the TCP connection.
+        over the TCP connection. All the requests are handed to the
+        transport in a single writelines() call so that a burst of
+        messages results in a single send() instead of one per message.
 
         Args:
-            request: The request string to send (will be encoded to bytes).
+            requests: The serialized requests to send.
+        """
+        for request in requests:
+            _LOGGER.debug(
+                "PROTOCOL: writing to transport: (size %d): %r", len(request), request
+            )
+        if self._writelines:
+            self._writelines(requests)
+
+    def _flush(self) -> None:
+        """Send queued requests, up to the in-flight budget, in one write.
+
+        Scheduled (at most once) via call_soon from sendRequest so that all
+        the requests issued in the same event loop iteration are coalesced.
+        The drain is bounded exactly like responseReceived: with the default
+        max_in_flight of 1, only the first request of a burst goes out here
+        and the rest stay queued until its response arrives.
         """
-        _LOGGER.debug(
-            f"PROTOCOL: writing to transport: (size {len(request)}): {request}"
-        )
-        if self._transport:
-            self._transport.write(request.encode())
+        self._flush_scheduled = False
 
-    def sendRequest(self, request: str) -> None:
+        if not self._out_queue:
+            return
+
+        # _out_pending counts queued and on-wire requests alike, so the
+        # difference is what is actually on the wire
+        in_flight = self._out_pending - len(self._out_queue)
+        allowed = self._max_in_flight - in_flight
+        if allowed > 0:
+            take = min(allowed, len(self._out_queue))
+            self._writeToTransport([self._out_queue.popleft() for _ in range(take)])
+
+    def sendRequest(self, request: bytes) -> None:
         """Send a request, enforcing flow control.
 
         The IntelliCenter struggles to parse concurrent requests, so this
@@ -220,50 +354,64 @@ class ICProtocol(asyncio.Protocol):
         reliable message delivery.
 
         Args:
-            request: The JSON request string to send.
+            request: The serialized JSON request to send.
         """
 
         # IntelliCenter seems to struggle to parse requests coming too fast
         # so we throttle back to one request on the wire at a time
         # see responseReceived() for the other side of the flow control
 
-        if self._out_pending == 0:
-            # Nothing in progress, we can transmit the packet immediately
-            self._writeToTransport(request)
-        else:
-            # There is already something on the wire, queue the request
-            # It will be sent when we receive the next response
-            self._out_queue.put(request)
-
-        # Count the new request as pending (whether queued or sent)
+        # Queue the packet; _flush and responseReceived decide when it is
+        # actually written
+        self._out_queue.append(request)
         self._out_pending += 1
-        self._last_flow_control_activity = asyncio.get_event_loop().time()
+        self._last_flow_control_activity = self._time()
+
+        # Schedule a flush for the end of this event loop iteration, but
+        # only if the in-flight budget has room; with the default budget
+        # of 1 a request issued while another is on the wire just waits
+        # for responseReceived to drain it
+        in_flight = self._out_pending - len(self._out_queue)
+        if in_flight < self._max_in_flight and not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop = self._loop or asyncio.get_event_loop()
+            if self._coalesce_delay > 0:
+                # user-space Nagle: hold the write briefly so requests
+                # issued just after this one ride in the same flush
+                loop.call_later(self._coalesce_delay, self._flush)
+            else:
+                loop.call_soon(self._flush)
 
     def responseReceived(self) -> None:
         """Handle flow control when a response is received.
 
         This method is called when we receive a response from the IntelliCenter.
         It implements the "other side" of the flow control mechanism by:
-        1. Sending the next queued request (if any)
-        2. Decrementing the pending request counter
+        1. Decrementing the pending request counter
+        2. Draining as many queued requests as the in-flight budget allows
+           (with the default max_in_flight of 1, exactly one) in a single
+           transport write
 
-        This ensures only one request is on the wire at a time.
+        This ensures at most max_in_flight requests are on the wire at a time.
         """
 
-        # We know that a response has been received, so if we have a
-        # pending request in the queue, we can write it to our transport
-        if not self._out_queue.empty():
-            request = self._out_queue.get()
-            self._writeToTransport(request)
-
-        # No matter what, we have now one less request pending
+        # The response settles one pending request
         if self._out_pending:
             self._out_pending -= 1
 
+        # Drain the queue up to the in-flight budget; with the default
+        # budget of 1 this sends exactly the next queued request, but the
+        # drained batch always goes out as a single write
+        in_flight = self._out_pending - len(self._out_queue)
+        allowed = self._max_in_flight - in_flight
+        if allowed > 0 and self._out_queue:
+            take = min(allowed, len(self._out_queue))
+            self._writeToTransport([self._out_queue.popleft() for _ in range(take)])
+
         # Track flow control activity for deadlock detection
-        self._last_flow_control_activity = asyncio.get_event_loop().time()
+        self._last_flow_control_activity = self._time()
 
-    def processMessage(self, message: str) -> None:
+    def processMessage(self, message: bytes) -> None:
         """Process a given message from IntelliCenter.
 
         Parses the JSON message and extracts the message ID, command, and
@@ -281,17 +429,28 @@ class ICProtocol(asyncio.Protocol):
         on strict correlation.
 
         Args:
-            message: A complete JSON message string from IntelliCenter.
+            message: A complete JSON message (raw bytes) from IntelliCenter.
         """
 
-        _LOGGER.debug(f"PROTOCOL: processMessage {message}")
+        _LOGGER.debug("PROTOCOL: processMessage %r", message)
+
+        # Cheap bailout for frames that cannot be JSON objects (stray
+        # log lines, banners after a reconnect, ...): a prefix check
+        # costs nothing, while letting the parser raise allocates an
+        # exception and traceback per bad frame
+        if not (message.startswith(b"{") and message.endswith(b"}")):
+            _LOGGER.error(
+                "PROTOCOL: non-JSON frame received: %s",
+                message[:100].decode(errors="replace"),
+            )
+            return
 
         # Various errors can occur when parsing/processing messages
         # We handle them gracefully to avoid disrupting the protocol
 
         try:
             # Parse the JSON message
-            msg: dict[str, Any] = json.loads(message)
+            msg: dict[str, Any] = _json_loads(message)
 
             # Extract required fields: messageID and command
             # NOTE: there seems to be a bug in IntelliCenter where
@@ -313,11 +472,16 @@ class ICProtocol(asyncio.Protocol):
 
         except json.JSONDecodeError as err:
             # Invalid JSON - log and continue (recoverable error)
-            _LOGGER.error(f"PROTOCOL: invalid JSON received: {message[:100]} - {err}")
+            # only decode (lazily) when we actually have to log
+            _LOGGER.error(
+                f"PROTOCOL: invalid JSON received: "
+                f"{message[:100].decode(errors='replace')} - {err}"
+            )
         except KeyError as err:
             # Missing required field - log and continue (recoverable error)
             _LOGGER.error(
-                f"PROTOCOL: message missing required field {err}: {message[:100]}"
+                f"PROTOCOL: message missing required field {err}: "
+                f"{message[:100].decode(errors='replace')}"
             )
         except Exception as err:
             # Unexpected error - close connection to trigger reconnection
@@ -330,6 +494,28 @@ class ICProtocol(asyncio.Protocol):
                 _LOGGER.warning("PROTOCOL: closing connection due to unexpected error")
                 self._transport.close()
 
+    def _next_wake_delay(self) -> float:
+        """Return the delay until the next heartbeat deadline.
+
+        The next wake is the earliest of the keepalive, flow control
+        (only when requests are pending) and idle-timeout deadlines,
+        clamped between HEARTBEAT_MIN_INTERVAL and HEARTBEAT_INTERVAL.
+        """
+        now = self._time()
+        delay = float(HEARTBEAT_INTERVAL)
+        if self._last_keepalive_sent:
+            delay = min(delay, KEEPALIVE_INTERVAL - (now - self._last_keepalive_sent))
+        if self._out_pending > 0 and self._last_flow_control_activity:
+            delay = min(
+                delay,
+                FLOW_CONTROL_TIMEOUT - (now - self._last_flow_control_activity),
+            )
+        if self._last_data_received:
+            delay = min(
+                delay, CONNECTION_IDLE_TIMEOUT - (now - self._last_data_received)
+            )
+        return max(delay, HEARTBEAT_MIN_INTERVAL)
+
     async def _heartbeat_loop(self) -> None:
         """Monitor connection health and send keepalive queries.
 
@@ -353,39 +539,51 @@ class ICProtocol(asyncio.Protocol):
         - Idle Timeout: If no data is received for CONNECTION_IDLE_TIMEOUT
           seconds, closes the connection. This should never happen with
           keepalives, but provides a safety net.
+
+        Instead of a fixed poll, each iteration sleeps until the earliest
+        upcoming deadline (see _next_wake_delay) so the loop reacts quickly
+        when a timeout is close and stays quiet otherwise.
         """
         try:
             while True:
-                await asyncio.sleep(HEARTBEAT_INTERVAL)
+                await asyncio.sleep(self._next_wake_delay())
 
                 if not self._transport or self._transport.is_closing():
                     _LOGGER.debug("PROTOCOL: heartbeat stopped - transport closed")
                     break
 
-                current_time = asyncio.get_event_loop().time()
+                current_time = self._time()
 
                 # Send keepalive query if needed
                 if self._last_keepalive_sent:
                     time_since_keepalive = current_time - self._last_keepalive_sent
                     if time_since_keepalive > KEEPALIVE_INTERVAL:
-                        _LOGGER.debug(
-                            f"PROTOCOL: sending keepalive query ({time_since_keepalive:.1f}s since last)"
-                        )
-                        # Send a lightweight query to keep the connection alive
-                        # Query the SYSTEM object's MODE attribute (always exists)
-                        try:
-                            self.sendCmd(
-                                "GetParamList",
-                                {
-                                    "condition": "OBJTYP=SYSTEM",
-                                    "objectList": [
-                                        {"objnam": "INCR", "keys": ["MODE"]}
-                                    ],
-                                },
-                            )
+                        # A keepalive is redundant while the connection is
+                        # already active: a request is in flight, or data
+                        # was received recently enough. The deadlock and
+                        # idle checks below still run either way.
+                        if self._out_pending or (
+                            self._last_data_received
+                            and (current_time - self._last_data_received)
+                            < KEEPALIVE_INTERVAL / 2
+                        ):
                             self._last_keepalive_sent = current_time
-                        except Exception as err:
-                            _LOGGER.debug(f"PROTOCOL: keepalive query failed: {err}")
+                        else:
+                            _LOGGER.debug(
+                                f"PROTOCOL: sending keepalive query ({time_since_keepalive:.1f}s since last)"
+                            )
+                            # Send a lightweight query to keep the connection
+                            # alive - query the SYSTEM object's MODE attribute
+                            # (always exists)
+                            try:
+                                packet = _KEEPALIVE_TEMPLATE % self._msgID
+                                self._msgID += 1
+                                self.sendRequest(packet)
+                                self._last_keepalive_sent = current_time
+                            except Exception as err:
+                                _LOGGER.debug(
+                                    f"PROTOCOL: keepalive query failed: {err}"
+                                )
 
                 # Check for flow control deadlock
                 if self._last_flow_control_activity:
@@ -403,11 +601,7 @@ class ICProtocol(asyncio.Protocol):
                         # Reset flow control state
                         self._out_pending = 0
                         # Clear the queue
-                        while not self._out_queue.empty():
-                            try:
-                                self._out_queue.get_nowait()
-                            except Exception:
-                                break
+                        self._out_queue.clear()
 
                 # Check for connection idle timeout (no data received)
                 if self._last_data_received:
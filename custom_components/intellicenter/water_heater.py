@@ -196,6 +196,7 @@ class PoolWaterHeater(PoolEntity, WaterHeaterEntity, RestoreEntity):
         self._turnOff()
 
     def _turnOff(self):
+        """Turn the heater off."""
         self.requestChanges({HEATER_ATTR: NULL_OBJNAM})
 
     def isUpdated(self, updates: dict[str, dict[str, str]]) -> bool:
@@ -3,26 +3,31 @@
 
 import asyncio
 import json
+from pathlib import Path
 import sys
 
+# allow running the script straight from the repository checkout
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-# Simple protocol to communicate with IntelliCenter
-class SimpleICProtocol(asyncio.Protocol):
-    """Simple protocol to query IntelliCenter."""
+from custom_components.intellicenter.pyintellicenter.protocol import (  # noqa: E402
+    ICProtocol,
+)
+
+
+class ExplorerController:
+    """Minimal controller stub so the script can reuse the real ICProtocol.
+
+    Implements just the callbacks ICProtocol needs; every received message
+    is forwarded to the on_data callback.
+    """
 
     def __init__(self, on_data):
         self._on_data = on_data
-        self._buffer = ""
-        self._transport = None
-        self._msg_id = 1
 
-    def connection_made(self, transport):
-        """Connection established."""
-        self._transport = transport
+    def connection_made(self, protocol, transport):
+        """Connection established: request all objects with all attributes."""
         print("Connected to IntelliCenter")
-
-        # Request all objects with all attributes
-        self.send_command(
+        protocol.sendCmd(
             "GetParamList",
             {
                 "condition": "",
@@ -45,36 +50,14 @@ class SimpleICProtocol(asyncio.Protocol):
             },
         )
 
-    def data_received(self, data):
-        """Data received from IntelliCenter."""
-        self._buffer += data.decode()
-
-        # Process complete lines
-        while "\r\n" in self._buffer:
-            line, self._buffer = self._buffer.split("\r\n", 1)
-            if line:
-                try:
-                    msg = json.loads(line)
-                    self._on_data(msg)
-                except json.JSONDecodeError as e:
-                    print(f"JSON decode error: {e}")
-                    print(f"Line: {line}")
-
-    def send_command(self, command, extra=None):
-        """Send a command to IntelliCenter."""
-        msg = {"messageID": str(self._msg_id), "command": command}
-        if extra:
-            msg.update(extra)
-
-        self._msg_id += 1
-        packet = json.dumps(msg) + "\r\n"
-        print(f"Sending: {msg}")
-        self._transport.write(packet.encode())
-
     def connection_lost(self, exc):
         """Connection lost."""
         print(f"Connection lost: {exc}")
 
+    def receivedMessage(self, msg_id, command, response, msg):
+        """Forward every message to the explorer."""
+        self._on_data(msg)
+
 
 class IntelliCenterExplorer:
     """Explore IntelliCenter objects."""
@@ -115,8 +98,9 @@ class IntelliCenterExplorer:
 
         try:
             print(f"Connecting to {self.host}:{self.port}...")
+            controller = ExplorerController(self.on_data)
             transport, protocol = await loop.create_connection(
-                lambda: SimpleICProtocol(self.on_data), self.host, self.port
+                lambda: ICProtocol(controller), self.host, self.port
             )
 
             # Wait for data
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""Quality scale validator for the IntelliCenter integration.
+
+Statically checks the integration source against the Home Assistant
+quality scale tiers (Bronze, Silver, Gold, Platinum) documented in
+docs/QUALITY_SCALE_COMPLIANCE.md. Each tier check returns a list of
+problems; an empty list means the tier's requirements are satisfied.
+
+Usage:
+    python scripts/quality_scale_validator.py
+"""
+
+import argparse
+import ast
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+import json
+import os
+from pathlib import Path
+import re
+import sys
+
+INTEGRATION_ROOT = (
+    Path(__file__).resolve().parents[1] / "custom_components" / "intellicenter"
+)
+
+# quality scale tiers, in ascending order
+TIERS = ["bronze", "silver", "gold", "platinum"]
+
+# every literal token the text-level checks look for, matched in a
+# single pass per file instead of one str-search per token; tokens are
+# bytes so files never need decoding just to be searched
+_TOKENS = (
+    b"ConnectionHandler",
+    b"[tool.mypy]",
+)
+_TOKEN_RE = re.compile(b"|".join(map(re.escape, _TOKENS)))
+
+# modules at the top of the package that never define entity platforms
+_SKIP_FILES = frozenset(
+    {
+        "__init__.py",
+        "config_flow.py",
+        "const.py",
+        "diagnostics.py",
+    }
+)
+
+
+def _base_name(base: ast.expr) -> str:
+    """Return the name of a base class expression."""
+    if isinstance(base, ast.Name):
+        return base.id
+    if isinstance(base, ast.Attribute):
+        return base.attr
+    return ""
+
+
+def _declares_name_source(node: ast.ClassDef) -> bool:
+    """Return True if a class body assigns _attr_has_entity_name or _attr_name."""
+    for item in node.body:
+        if isinstance(item, ast.Assign):
+            targets = item.targets
+        elif isinstance(item, ast.AnnAssign):
+            targets = [item.target]
+        else:
+            continue
+        for target in targets:
+            if isinstance(target, ast.Name) and target.id in (
+                "_attr_has_entity_name",
+                "_attr_name",
+            ):
+                return True
+    return False
+
+
+class _IntegrationVisitor(ast.NodeVisitor):
+    """Collect everything the tier checks need in a single AST traversal.
+
+    Several checks want AST-level facts about the same files (entity
+    classes, config flow classes, missing docstrings). Instead of each
+    check walking the tree on its own, this visitor gathers all of them
+    in one pass and the validator caches the result per file.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty collections."""
+        self.class_defs: list[ast.ClassDef] = []
+        self.config_flow_classes: list[str] = []
+        self.undocumented: list[tuple[int, str]] = []
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        """Record a class definition and classify it."""
+        self.class_defs.append(node)
+        if any("ConfigFlow" in ast.dump(base) for base in node.bases):
+            self.config_flow_classes.append(node.name)
+        if ast.get_docstring(node) is None:
+            self.undocumented.append((node.lineno, node.name))
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Record a function missing its docstring."""
+        if ast.get_docstring(node) is None:
+            self.undocumented.append((node.lineno, node.name))
+        self.generic_visit(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        """Record an async function missing its docstring."""
+        if ast.get_docstring(node) is None:
+            self.undocumented.append((node.lineno, node.name))
+        self.generic_visit(node)
+
+
+class QualityScaleValidator:
+    """Validate the integration source against the quality scale tiers."""
+
+    def __init__(self, root: Path = INTEGRATION_ROOT) -> None:
+        """Initialize the validator.
+
+        Args:
+            root: Path to the integration package
+                 (custom_components/intellicenter).
+        """
+        self.root = Path(root)
+
+        # each file is read and parsed at most once, no matter how many
+        # tier checks consume it
+        self._text_cache: dict[Path, bytes | None] = {}
+        self._ast_cache: dict[Path, ast.Module] = {}
+        self._visitor_cache: dict[Path, _IntegrationVisitor] = {}
+        self._token_cache: dict[Path, frozenset[bytes]] = {}
+
+    def _read(self, path: Path) -> bytes:
+        """Return the (cached) raw content of a file that must exist."""
+        data = self._read_or_none(path)
+        if data is None:
+            raise FileNotFoundError(path)
+        return data
+
+    def _read_or_none(self, path: Path) -> bytes | None:
+        """Return the (cached) raw content of a file, or None if absent.
+
+        Reading directly and catching the error costs one syscall where
+        the exists()/read pattern costs two. The content stays bytes:
+        json.loads, ast.parse and the token regex all accept bytes, so
+        nothing ever pays for a utf-8 decode.
+        """
+        if path in self._text_cache:
+            return self._text_cache[path]
+        try:
+            data: bytes | None = path.read_bytes()
+        except OSError:
+            data = None
+        self._text_cache[path] = data
+        return data
+
+    def _parse(self, path: Path) -> ast.Module:
+        """Return the (cached) parsed AST of a python file."""
+        tree = self._ast_cache.get(path)
+        if tree is None:
+            tree = self._ast_cache[path] = ast.parse(self._read(path))
+        return tree
+
+    def _tokens(self, path: Path) -> frozenset[bytes]:
+        """Return the set of known tokens present in a file."""
+        tokens = self._token_cache.get(path)
+        if tokens is None:
+            found = _TOKEN_RE.findall(self._read(path))
+            tokens = self._token_cache[path] = frozenset(found)
+        return tokens
+
+    def _parse_all(self, paths: list[Path]) -> None:
+        """Pre-fill the AST cache for a batch of files.
+
+        ast.parse holds the GIL, so the parse work itself serializes;
+        the thread pool only overlaps the disk reads inside _parse,
+        which is still a win on a cold cache. Below a handful of files
+        the pool startup overhead outweighs the gain, so small batches
+        parse inline.
+        """
+        missing = [path for path in paths if path not in self._ast_cache]
+        if len(missing) <= 4:
+            for path in missing:
+                self._parse(path)
+            return
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            # _parse stores each result in the cache itself
+            list(pool.map(self._parse, missing))
+
+    def _visit(self, path: Path) -> _IntegrationVisitor:
+        """Return the (cached) single-pass visitor results for a file."""
+        visitor = self._visitor_cache.get(path)
+        if visitor is None:
+            visitor = self._visitor_cache[path] = _IntegrationVisitor()
+            visitor.visit(self._parse(path))
+        return visitor
+
+    # -- file discovery ---------------------------------------------------
+
+    @cached_property
+    def python_files(self) -> list[Path]:
+        """Return all the python files of the integration.
+
+        Computed once per validator instance; every tier check indexes
+        into the same sorted listing instead of re-scanning the tree.
+
+        Uses os.scandir rather than pathlib.glob: scandir surfaces the
+        file type straight from the directory entry, so discovery does
+        not stat() every path a second time.
+        """
+        files: list[Path] = []
+        stack = [self.root]
+        while stack:
+            folder = stack.pop()
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != "__pycache__":
+                            stack.append(Path(entry.path))
+                    elif entry.name.endswith(".py"):
+                        files.append(Path(entry.path))
+        return sorted(files)
+
+    @cached_property
+    def entity_platform_files(self) -> list[Path]:
+        """Return the python files that may define entity platforms."""
+        return [
+            path
+            for path in self.python_files
+            if path.parent == self.root and path.name not in _SKIP_FILES
+        ]
+
+    # -- tier checks ------------------------------------------------------
+
+    def check_bronze(self) -> list[str]:
+        """Check the Bronze tier: manifest, config flow and strings."""
+        problems: list[str] = []
+
+        manifest = self.root / "manifest.json"
+        manifest_text = self._read_or_none(manifest)
+        if manifest_text is not None:
+            data = json.loads(manifest_text)
+            for key in ("domain", "name", "version", "codeowners"):
+                if not data.get(key):
+                    problems.append(f"manifest.json: missing '{key}'")
+        else:
+            problems.append("manifest.json is missing")
+
+        config_flow = self.root / "config_flow.py"
+        if self._read_or_none(config_flow) is not None:
+            if not self._visit(config_flow).config_flow_classes:
+                problems.append("config_flow.py: no config flow class found")
+        else:
+            problems.append("config_flow.py is missing (UI setup required)")
+
+        if not (self.root / "strings.json").exists():
+            problems.append("strings.json is missing")
+
+        return problems
+
+    def check_silver(self) -> list[str]:
+        """Check the Silver tier: code owner and connection recovery."""
+        problems: list[str] = []
+
+        manifest = self.root / "manifest.json"
+        manifest_text = self._read_or_none(manifest)
+        if manifest_text is not None:
+            data = json.loads(manifest_text)
+            if not data.get("codeowners"):
+                problems.append("manifest.json: no code owner declared")
+
+        controller = self.root / "pyintellicenter" / "controller.py"
+        if self._read_or_none(controller) is not None:
+            if b"ConnectionHandler" not in self._tokens(controller):
+                problems.append(
+                    "controller.py: no ConnectionHandler (reconnection required)"
+                )
+        else:
+            problems.append("pyintellicenter/controller.py is missing")
+
+        return problems
+
+    def check_gold(self) -> list[str]:
+        """Check the Gold tier: discovery, diagnostics and translations."""
+        problems: list[str] = []
+
+        manifest = self.root / "manifest.json"
+        manifest_text = self._read_or_none(manifest)
+        if manifest_text is not None:
+            data = json.loads(manifest_text)
+            if not data.get("zeroconf"):
+                problems.append("manifest.json: no zeroconf discovery configured")
+
+        if not (self.root / "diagnostics.py").exists():
+            problems.append("diagnostics.py is missing")
+
+        translations = self.root / "translations"
+        if not (translations / "en.json").exists():
+            problems.append("translations/en.json is missing")
+
+        problems.extend(self._check_has_entity_name())
+
+        return problems
+
+    def check_platinum(self) -> list[str]:
+        """Check the Platinum tier: strict typing setup and documentation."""
+        problems: list[str] = []
+
+        mypy_ini = self.root.parents[1] / "mypy.ini"
+        pyproject = self.root.parents[1] / "pyproject.toml"
+        if not mypy_ini.exists() and (
+            self._read_or_none(pyproject) is None
+            or b"[tool.mypy]" not in self._tokens(pyproject)
+        ):
+            problems.append("no mypy configuration found")
+
+        # every module, class and function must carry a docstring
+        paths = self.python_files
+        self._parse_all(paths)
+        for path in paths:
+            relative = path.relative_to(self.root)
+            if ast.get_docstring(self._parse(path)) is None:
+                problems.append(f"{relative}: module has no docstring")
+            for lineno, name in self._visit(path).undocumented:
+                problems.append(f"{relative}:{lineno}: '{name}' has no docstring")
+
+        return problems
+
+    def _check_has_entity_name(self) -> list[str]:
+        """Check that every entity class sets an explicit name source.
+
+        Entity classes are expected to either set _attr_has_entity_name /
+        _attr_name or define a name property (PoolEntity does the latter
+        for the whole integration).
+        """
+        problems: list[str] = []
+
+        for path in self.entity_platform_files:
+            # entity classes are always module-level, so iterating the
+            # module body directly beats a full-tree walk
+            for node in self._parse(path).body:
+                if not isinstance(node, ast.ClassDef):
+                    continue
+                bases = [_base_name(base) for base in node.bases]
+                if not any("Entity" in base for base in bases):
+                    continue
+                if "PoolEntity" in bases:
+                    # PoolEntity provides the name property for all entities
+                    continue
+                if not _declares_name_source(node):
+                    problems.append(
+                        f"{path.name}:{node.lineno}: entity class "
+                        f"'{node.name}' does not declare a name source"
+                    )
+
+        return problems
+
+    # -- entry point ------------------------------------------------------
+
+    def validate(self) -> dict[str, list[str]]:
+        """Run every tier check and return the problems per tier."""
+        return {
+            "bronze": self.check_bronze(),
+            "silver": self.check_silver(),
+            "gold": self.check_gold(),
+            "platinum": self.check_platinum(),
+        }
+
+
+def main() -> int:
+    """Run the validator and print a per-tier report.
+
+    Tiers run in ascending order and, by default, the first failing
+    tier stops the run: a Bronze failure makes the Gold and Platinum
+    results meaningless and their checks are the expensive ones.
+    Pass --no-fail-fast to always produce the full report.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--no-fail-fast",
+        action="store_true",
+        help="run every tier even if an earlier tier fails",
+    )
+    args = parser.parse_args()
+
+    validator = QualityScaleValidator()
+
+    failed = False
+    for tier in TIERS:
+        problems = getattr(validator, f"check_{tier}")()
+        status = "PASS" if not problems else "FAIL"
+        print(f"{tier.capitalize():10s} {status}")
+        for problem in problems:
+            print(f"    - {problem}")
+        if problems:
+            failed = True
+            if not args.no_fail_fast:
+                skipped = TIERS[TIERS.index(tier) + 1 :]
+                if skipped:
+                    print(f"skipped: {', '.join(skipped)}")
+                break
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,22 @@
 """Fixtures for Pentair IntelliCenter integration tests."""
 
+from __future__ import annotations
+
 from collections.abc import Generator
+import copy
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from homeassistant.const import CONF_HOST
 import pytest
 
+from custom_components.intellicenter import config_flow
 from custom_components.intellicenter.pyintellicenter import (
-    ModelController,
+    BaseController,
     PoolModel,
     PoolObject,
-    SystemInfo,
 )
 from custom_components.intellicenter.pyintellicenter.attributes import (
     BODY_TYPE,
@@ -33,40 +39,108 @@ def auto_enable_custom_integrations(enable_custom_integrations):
     yield
 
 
+@dataclass(frozen=True, slots=True)
+class _FakeSystemInfo:
+    """Plain data stand-in for SystemInfo.
+
+    SystemInfo only exposes read-only properties, so a frozen dataclass
+    is enough; it is far cheaper to build than a spec'd MagicMock with
+    property wiring.
+    """
+
+    uniqueID: str = "test-unique-id-123"
+    propName: str = "Test Pool System"
+    swVersion: str = "2.0.0"
+    usesMetric: bool = False
+
+
+@pytest.fixture(scope="session")
+def mock_system_info() -> _FakeSystemInfo:
+    """Return a fake SystemInfo object, shared across the session."""
+    return _FakeSystemInfo()
+
+
 @pytest.fixture
-def mock_system_info() -> SystemInfo:
-    """Return a mock SystemInfo object."""
-    mock_info = MagicMock(spec=SystemInfo)
-    # Configure property return values using PropertyMock
-    type(mock_info).uniqueID = property(lambda self: "test-unique-id-123")
-    type(mock_info).propName = property(lambda self: "Test Pool System")
-    type(mock_info).swVersion = property(lambda self: "2.0.0")
-    type(mock_info).usesMetric = property(lambda self: False)
-    return mock_info
+def mock_entry() -> SimpleNamespace:
+    """Return a config entry stand-in with default id and data.
+
+    The integration only reads entry_id and data in these tests, so a
+    SimpleNamespace beats even a spec'd MagicMock: no attribute-set
+    walk on construction and no mock dispatch on access. Flows that
+    need a registrable entry keep using MockConfigEntry.
+    """
+    return SimpleNamespace(entry_id="test_entry", data={CONF_HOST: "192.168.1.100"})
+
+
+@pytest.fixture(scope="session")
+def _controller_mock() -> MagicMock:
+    """Build the BaseController mock graph once per session.
+
+    Constructing a MagicMock with AsyncMock children is non-trivial
+    work; the graph is shared across tests and reset per test by
+    mock_controller.
+    """
+    return MagicMock(spec=BaseController, start=AsyncMock(), stop=MagicMock())
 
 
 @pytest.fixture
-def mock_controller(mock_system_info: SystemInfo) -> Generator[MagicMock, None, None]:
-    """Return a mock BaseController."""
-    with patch(
-        "custom_components.intellicenter.config_flow.BaseController"
-    ) as mock_controller_class:
-        mock_instance = MagicMock()
-        mock_instance.start = AsyncMock()
-        mock_instance.stop = MagicMock()
-        mock_instance.systemInfo = mock_system_info
-        mock_controller_class.return_value = mock_instance
-        yield mock_instance
+def mock_controller(
+    _controller_mock: MagicMock,
+    mock_system_info: _FakeSystemInfo,
+) -> Generator[MagicMock, None, None]:
+    """Return a mock BaseController, patched into the config flow."""
+    # clear call history and any side effects set by the previous test
+    _controller_mock.reset_mock(return_value=True, side_effect=True)
+    _controller_mock.systemInfo = mock_system_info
+    # tests may replace start with a plain coroutine function; put the
+    # shared AsyncMock back afterwards
+    start_mock = _controller_mock.start
+    # patch.object on the imported module resolves the target once at
+    # import time instead of walking sys.modules per test
+    with patch.object(config_flow, "BaseController", return_value=_controller_mock):
+        yield _controller_mock
+    _controller_mock.start = start_mock
+
+
+class _RequestRecorder:
+    """requestChanges stand-in that just records its calls.
+
+    Deliberately synchronous: the real ModelController.requestChanges
+    is a plain method and entities call it fire-and-forget, so a
+    coroutine body would never run (and an AsyncMock would leave a
+    never-awaited coroutine behind). Appending to a list is enough.
+    """
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple, dict]] = []
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.calls.append((args, kwargs))
 
 
 @pytest.fixture
-def pool_model_data() -> list[dict[str, Any]]:
-    """Return test data for a complete pool model."""
-    return [
+def recording_controller() -> SimpleNamespace:
+    """Return a controller stand-in that records requestChanges calls.
+
+    Entity action tests for every platform share this shape: the
+    entity only ever calls requestChanges, and the test inspects
+    .requestChanges.calls afterwards.
+    """
+    return SimpleNamespace(requestChanges=_RequestRecorder())
+
+
+# canonical pool model test data, built once at import time; the params
+# are wrapped in read-only views because PoolObject pops keys from the
+# params dict it is given, so every test must work on its own copy
+_POOL_MODEL_DATA: tuple[dict[str, Any], ...] = tuple(
+    {"objnam": objnam, "params": MappingProxyType(params)}
+    for objnam, params in [
         # System object
-        {
-            "objnam": "SYS01",
-            "params": {
+        (
+            "SYS01",
+            {
                 "OBJTYP": SYSTEM_TYPE,
                 "SNAME": "IntelliCenter System",
                 "PROPNAME": "Test Pool System",
@@ -74,11 +148,11 @@ def pool_model_data() -> list[dict[str, Any]]:
                 "VER": "2.0.0",
                 "STATUS": "READY",
             },
-        },
+        ),
         # Pool body
-        {
-            "objnam": "POOL1",
-            "params": {
+        (
+            "POOL1",
+            {
                 "OBJTYP": BODY_TYPE,
                 "SUBTYP": "POOL",
                 "SNAME": "Pool",
@@ -88,11 +162,11 @@ def pool_model_data() -> list[dict[str, Any]]:
                 "HEATER": "HTR01",
                 "HTMODE": "1",
             },
-        },
+        ),
         # Spa body
-        {
-            "objnam": "SPA01",
-            "params": {
+        (
+            "SPA01",
+            {
                 "OBJTYP": BODY_TYPE,
                 "SUBTYP": "SPA",
                 "SNAME": "Spa",
@@ -102,11 +176,11 @@ def pool_model_data() -> list[dict[str, Any]]:
                 "HEATER": "HTR01",
                 "HTMODE": "0",
             },
-        },
+        ),
         # IntelliBrite light (supports color effects)
-        {
-            "objnam": "LIGHT1",
-            "params": {
+        (
+            "LIGHT1",
+            {
                 "OBJTYP": CIRCUIT_TYPE,
                 "SUBTYP": "INTELLI",
                 "SNAME": "Pool Light",
@@ -114,55 +188,55 @@ def pool_model_data() -> list[dict[str, Any]]:
                 "USE": "WHITER",
                 "FEATR": "ON",
             },
-        },
+        ),
         # Regular light (no color effects)
-        {
-            "objnam": "LIGHT2",
-            "params": {
+        (
+            "LIGHT2",
+            {
                 "OBJTYP": CIRCUIT_TYPE,
                 "SUBTYP": "LIGHT",
                 "SNAME": "Spa Light",
                 "STATUS": "OFF",
                 "FEATR": "ON",
             },
-        },
+        ),
         # Light show
-        {
-            "objnam": "SHOW1",
-            "params": {
+        (
+            "SHOW1",
+            {
                 "OBJTYP": CIRCUIT_TYPE,
                 "SUBTYP": "LITSHO",
                 "SNAME": "Party Show",
                 "STATUS": "OFF",
                 "FEATR": "ON",
             },
-        },
+        ),
         # Featured circuit (switch)
-        {
-            "objnam": "CIRC01",
-            "params": {
+        (
+            "CIRC01",
+            {
                 "OBJTYP": CIRCUIT_TYPE,
                 "SUBTYP": "GENERIC",
                 "SNAME": "Pool Cleaner",
                 "STATUS": "OFF",
                 "FEATR": "ON",
             },
-        },
+        ),
         # Non-featured circuit (should not create switch)
-        {
-            "objnam": "CIRC02",
-            "params": {
+        (
+            "CIRC02",
+            {
                 "OBJTYP": CIRCUIT_TYPE,
                 "SUBTYP": "GENERIC",
                 "SNAME": "Aux Circuit",
                 "STATUS": "OFF",
                 "FEATR": "OFF",
             },
-        },
+        ),
         # Pump
-        {
-            "objnam": "PUMP1",
-            "params": {
+        (
+            "PUMP1",
+            {
                 "OBJTYP": PUMP_TYPE,
                 "SUBTYP": "VS",
                 "SNAME": "Pool Pump",
@@ -171,21 +245,21 @@ def pool_model_data() -> list[dict[str, Any]]:
                 "RPM": "2000",
                 "GPM": "55",
             },
-        },
+        ),
         # Heater
-        {
-            "objnam": "HTR01",
-            "params": {
+        (
+            "HTR01",
+            {
                 "OBJTYP": HEATER_TYPE,
                 "SUBTYP": "GAS",
                 "SNAME": "Gas Heater",
                 "STATUS": "OFF",
             },
-        },
+        ),
         # Chemistry sensor
-        {
-            "objnam": "CHEM1",
-            "params": {
+        (
+            "CHEM1",
+            {
                 "OBJTYP": CHEM_TYPE,
                 "SNAME": "IntelliChem",
                 "PHVAL": "7.4",
@@ -193,27 +267,37 @@ def pool_model_data() -> list[dict[str, Any]]:
                 "PHTNK": "5",
                 "ORPTNK": "3",
             },
-        },
+        ),
         # Temperature sensor
-        {
-            "objnam": "SENSE1",
-            "params": {
+        (
+            "SENSE1",
+            {
                 "OBJTYP": SENSE_TYPE,
                 "SUBTYP": "AIR",
                 "SNAME": "Air Temp",
                 "STATUS": "68",
             },
-        },
+        ),
         # Schedule
-        {
-            "objnam": "SCHED1",
-            "params": {
+        (
+            "SCHED1",
+            {
                 "OBJTYP": SCHED_TYPE,
                 "SNAME": "Morning Filter",
                 "STATUS": "OFF",
                 "ENABLE": "ON",
             },
-        },
+        ),
+    ]
+)
+
+
+@pytest.fixture
+def pool_model_data() -> list[dict[str, Any]]:
+    """Return a fresh, mutable copy of the pool model test data."""
+    return [
+        {"objnam": entry["objnam"], "params": dict(entry["params"])}
+        for entry in _POOL_MODEL_DATA
     ]
 
 
@@ -225,9 +309,9 @@ def pool_model(pool_model_data: list[dict[str, Any]]) -> PoolModel:
     return model
 
 
-@pytest.fixture
-def pool_object_light() -> PoolObject:
-    """Return a PoolObject representing an IntelliBrite light."""
+@pytest.fixture(scope="session")
+def _pool_object_light_template() -> PoolObject:
+    """Build the IntelliBrite light object once per session."""
     return PoolObject(
         "LIGHT1",
         {
@@ -241,6 +325,19 @@ def pool_object_light() -> PoolObject:
     )
 
 
+@pytest.fixture
+def pool_object_light(_pool_object_light_template: PoolObject) -> PoolObject:
+    """Return a PoolObject representing an IntelliBrite light.
+
+    Tests mutate the object through update(), so each gets a shallow
+    copy of the session template with its own properties dict; that is
+    one dict clone instead of a full PoolObject.__init__.
+    """
+    obj = copy.copy(_pool_object_light_template)
+    obj._properties = dict(_pool_object_light_template._properties)
+    return obj
+
+
 @pytest.fixture
 def pool_object_switch() -> PoolObject:
     """Return a PoolObject representing a featured circuit (switch)."""
@@ -289,37 +386,3 @@ def pool_object_body() -> PoolObject:
             "HTMODE": "1",
         },
     )
-
-
-@pytest.fixture
-def mock_model_controller(
-    pool_model: PoolModel,
-) -> Generator[ModelController, None, None]:
-    """Return a mock ModelController for integration tests."""
-    with patch(
-        "custom_components.intellicenter.ModelController"
-    ) as mock_controller_class:
-        mock_instance = MagicMock(spec=ModelController)
-        mock_instance.start = AsyncMock()
-        mock_instance.stop = MagicMock()
-        mock_instance.requestChanges = AsyncMock()
-        mock_instance.model = pool_model
-
-        # Add system info properties
-        system_obj = pool_model["SYS01"]
-        mock_instance.systemInfo = MagicMock()
-        type(mock_instance.systemInfo).uniqueID = property(
-            lambda self: "test-unique-id-123"
-        )
-        type(mock_instance.systemInfo).propName = property(
-            lambda self: system_obj.properties.get("PROPNAME", "Test Pool System")
-        )
-        type(mock_instance.systemInfo).swVersion = property(
-            lambda self: system_obj.properties.get("VER", "2.0.0")
-        )
-        type(mock_instance.systemInfo).usesMetric = property(
-            lambda self: system_obj.properties.get("MODE") == "METRIC"
-        )
-
-        mock_controller_class.return_value = mock_instance
-        yield mock_instance
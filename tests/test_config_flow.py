@@ -1,6 +1,7 @@
 """Test the Pentair IntelliCenter config flow."""
 
-from unittest.mock import MagicMock
+from dataclasses import dataclass
+from unittest.mock import MagicMock, patch
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
@@ -11,7 +12,45 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.intellicenter.const import DOMAIN
 
-pytestmark = pytest.mark.asyncio
+
+@dataclass(frozen=True, slots=True)
+class _DiscoveryInfo:
+    """Plain stand-in for zeroconf discovery info.
+
+    ZeroconfServiceInfo itself needs the zeroconf package; the config
+    flow only reads plain attributes, and a dataclass serves them
+    without mock dispatch.
+    """
+
+    host: str = "192.168.1.100"
+    hostname: str = "pentair-intellicenter.local."
+    name: str = "pentair-intellicenter"
+    type: str = "_http._tcp.local."
+
+
+@pytest.fixture
+def discovery_info() -> _DiscoveryInfo:
+    """Return discovery info for a system at 192.168.1.100."""
+    return _DiscoveryInfo()
+
+
+async def _raise_refused(*args, **kwargs):
+    """Fail like an unreachable IntelliCenter, without AsyncMock overhead."""
+    raise ConnectionRefusedError
+
+
+async def _raise_unexpected(*args, **kwargs):
+    """Fail with an unexpected error, without AsyncMock overhead."""
+    raise Exception("Unexpected error")  # noqa: TRY002
+
+
+@pytest.fixture(autouse=True)
+def mock_setup_entry():
+    """Keep CREATE_ENTRY results from running the real integration setup."""
+    with patch(
+        "custom_components.intellicenter.async_setup_entry", return_value=True
+    ) as mock_setup:
+        yield mock_setup
 
 
 async def test_user_flow_success(
@@ -35,31 +74,18 @@ async def test_user_flow_success(
     assert result["data"] == {CONF_HOST: "192.168.1.100"}
 
 
-async def test_user_flow_cannot_connect(
-    hass: HomeAssistant, mock_controller: MagicMock
-) -> None:
-    """Test user flow when connection fails."""
-    mock_controller.start.side_effect = ConnectionRefusedError()
-
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {CONF_HOST: "192.168.1.100"},
-    )
-
-    assert result["type"] == FlowResultType.FORM
-    assert result["step_id"] == "user"
-    assert result["errors"] == {"base": "cannot_connect"}
-
-
-async def test_user_flow_unexpected_exception(
-    hass: HomeAssistant, mock_controller: MagicMock
+@pytest.mark.parametrize(
+    ("start", "error"),
+    [
+        (_raise_refused, "cannot_connect"),
+        (_raise_unexpected, "unknown"),
+    ],
+)
+async def test_user_flow_connection_failure(
+    hass: HomeAssistant, mock_controller: MagicMock, start, error: str
 ) -> None:
-    """Test user flow when unexpected exception occurs."""
-    mock_controller.start.side_effect = Exception("Unexpected error")
+    """Test user flow when connecting to the system fails."""
+    mock_controller.start = start
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -72,7 +98,7 @@ async def test_user_flow_unexpected_exception(
 
     assert result["type"] == FlowResultType.FORM
     assert result["step_id"] == "user"
-    assert result["errors"] == {"base": "unknown"}
+    assert result["errors"] == {"base": error}
 
 
 async def test_user_flow_already_configured(
@@ -101,15 +127,9 @@ async def test_user_flow_already_configured(
 
 
 async def test_zeroconf_flow_success(
-    hass: HomeAssistant, mock_controller: MagicMock
+    hass: HomeAssistant, mock_controller: MagicMock, discovery_info: _DiscoveryInfo
 ) -> None:
     """Test successful zeroconf discovery flow."""
-    discovery_info = MagicMock()
-    discovery_info.host = "192.168.1.100"
-    discovery_info.hostname = "pentair-intellicenter.local."
-    discovery_info.name = "pentair-intellicenter"
-    discovery_info.type = "_http._tcp.local."
-
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": config_entries.SOURCE_ZEROCONF},
@@ -134,7 +154,7 @@ async def test_zeroconf_flow_success(
 
 
 async def test_zeroconf_flow_already_configured_host(
-    hass: HomeAssistant, mock_controller: MagicMock
+    hass: HomeAssistant, mock_controller: MagicMock, discovery_info: _DiscoveryInfo
 ) -> None:
     """Test zeroconf flow when host is already configured."""
     # Create an existing entry with the same host
@@ -145,10 +165,6 @@ async def test_zeroconf_flow_already_configured_host(
     )
     entry.add_to_hass(hass)
 
-    discovery_info = MagicMock()
-    discovery_info.host = "192.168.1.100"
-    discovery_info.hostname = "pentair-intellicenter.local."
-
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": config_entries.SOURCE_ZEROCONF},
@@ -159,15 +175,22 @@ async def test_zeroconf_flow_already_configured_host(
     assert result["reason"] == "already_configured"
 
 
-async def test_zeroconf_flow_cannot_connect(
-    hass: HomeAssistant, mock_controller: MagicMock
+@pytest.mark.parametrize(
+    ("start", "reason"),
+    [
+        (_raise_refused, "cannot_connect"),
+        (_raise_unexpected, "unknown"),
+    ],
+)
+async def test_zeroconf_flow_connection_failure(
+    hass: HomeAssistant,
+    mock_controller: MagicMock,
+    discovery_info: _DiscoveryInfo,
+    start,
+    reason: str,
 ) -> None:
-    """Test zeroconf flow when connection fails."""
-    mock_controller.start.side_effect = ConnectionRefusedError()
-
-    discovery_info = MagicMock()
-    discovery_info.host = "192.168.1.100"
-    discovery_info.hostname = "pentair-intellicenter.local."
+    """Test zeroconf flow when connecting to the system fails."""
+    mock_controller.start = start
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
@@ -176,11 +199,11 @@ async def test_zeroconf_flow_cannot_connect(
     )
 
     assert result["type"] == FlowResultType.ABORT
-    assert result["reason"] == "cannot_connect"
+    assert result["reason"] == reason
 
 
 async def test_zeroconf_flow_updates_existing_entry(
-    hass: HomeAssistant, mock_controller: MagicMock
+    hass: HomeAssistant, mock_controller: MagicMock, discovery_info: _DiscoveryInfo
 ) -> None:
     """Test zeroconf flow updates existing entry with new IP."""
     # Create an existing entry with the same unique ID but different host
@@ -191,10 +214,6 @@ async def test_zeroconf_flow_updates_existing_entry(
     )
     entry.add_to_hass(hass)
 
-    discovery_info = MagicMock()
-    discovery_info.host = "192.168.1.100"
-    discovery_info.hostname = "pentair-intellicenter.local."
-
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": config_entries.SOURCE_ZEROCONF},
@@ -140,9 +140,15 @@ class TestBaseController:
     """Test BaseController class."""
 
     @pytest.fixture
-    def controller(self):
+    def loop(self):
+        """Create an event loop that is explicitly closed after the test."""
+        loop = asyncio.new_event_loop()
+        yield loop
+        loop.close()
+
+    @pytest.fixture
+    def controller(self, loop):
         """Create a BaseController instance."""
-        loop = asyncio.get_event_loop()
         return BaseController("192.168.1.100", 6681, loop)
 
     def test_init(self, controller):
@@ -178,12 +184,12 @@ class TestBaseController:
 
         assert callback_called
 
-    def test_stop(self, controller):
+    def test_stop(self, controller, loop):
         """Test stopping controller."""
         # Create mock transport and pending requests
         controller._transport = Mock()
-        future1 = asyncio.Future()
-        future2 = asyncio.Future()
+        future1 = loop.create_future()
+        future2 = loop.create_future()
         controller._requests = {"1": future1, "2": future2}
 
         controller.stop()
@@ -223,9 +229,9 @@ class TestBaseController:
         with pytest.raises(Exception, match="controller disconnected"):
             future.result()
 
-    def test_receivedMessage_sets_result(self, controller):
+    def test_receivedMessage_sets_result(self, controller, loop):
         """Test receivedMessage sets future result."""
-        future = asyncio.Future()
+        future = loop.create_future()
         controller._requests = {"1": future}
 
         msg = {"response": "200", "data": "test"}
@@ -235,9 +241,9 @@ class TestBaseController:
         assert future.result() == msg
         assert "1" not in controller._requests
 
-    def test_receivedMessage_sets_exception(self, controller):
+    def test_receivedMessage_sets_exception(self, controller, loop):
         """Test receivedMessage sets exception on error."""
-        future = asyncio.Future()
+        future = loop.create_future()
         controller._requests = {"1": future}
 
         msg = {"response": "400"}
@@ -273,17 +279,32 @@ class TestBaseController:
 class TestModelController:
     """Test ModelController class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def model(self):
-        """Create a PoolModel instance."""
+        """Create a PoolModel instance, shared across the module."""
         return PoolModel()
 
-    @pytest.fixture
-    def controller(self, model):
-        """Create a ModelController instance."""
-        loop = asyncio.get_event_loop()
+    @pytest.fixture(scope="module")
+    def loop(self):
+        """Create an event loop that is explicitly closed after the module."""
+        loop = asyncio.new_event_loop()
+        yield loop
+        loop.close()
+
+    @pytest.fixture(scope="module")
+    def controller(self, model, loop):
+        """Create a ModelController instance, shared across the module."""
         return ModelController("192.168.1.100", model, 6681, loop)
 
+    @pytest.fixture(autouse=True)
+    def _reset(self, controller):
+        """Give every test a clean model and controller state."""
+        yield
+        controller.model._objects.clear()
+        controller.model._objectsByType.clear()
+        controller._updatedCallback = None
+        controller._systemInfo = None
+
     def test_init(self, controller, model):
         """Test ModelController initialization."""
         assert controller.model == model
@@ -357,11 +378,12 @@ class TestConnectionHandler:
     @pytest.fixture
     def mock_controller(self):
         """Create mock controller."""
-        controller = Mock()
-        controller.start = AsyncMock()
-        controller.stop = Mock()
-        controller.host = "192.168.1.100"
-        return controller
+        return Mock(
+            spec=BaseController,
+            start=AsyncMock(),
+            stop=Mock(),
+            host="192.168.1.100",
+        )
 
     @pytest.fixture
     def handler(self, mock_controller):
@@ -377,19 +399,15 @@ class TestConnectionHandler:
 
     async def test_start_connects(self, handler, mock_controller):
         """Test start connects controller."""
-        started_called = False
-
-        def on_started(controller):
-            nonlocal started_called
-            started_called = True
-
-        handler.started = on_started
+        started = asyncio.Event()
+        handler.started = lambda controller: started.set()
 
         await handler.start()
-        await asyncio.sleep(0.2)
+        # wait on the handler's own connection event, no wall-clock sleep
+        await asyncio.wait_for(handler._connected_event.wait(), timeout=1)
 
         mock_controller.start.assert_called()
-        assert started_called
+        assert started.is_set()
 
         # Cleanup
         handler.stop()
@@ -397,18 +415,18 @@ class TestConnectionHandler:
     async def test_stop(self, handler, mock_controller):
         """Test stopping handler."""
         await handler.start()
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(handler._connected_event.wait(), timeout=1)
 
         handler.stop()
 
         assert handler._stopped is True
         mock_controller.stop.assert_called()
 
-    async def test_exponential_backoff(self, handler):
+    def test_exponential_backoff(self):
         """Test exponential backoff calculation."""
-        delay1 = handler._next_delay(10)
-        delay2 = handler._next_delay(delay1)
-        delay3 = handler._next_delay(delay2)
+        delay1 = ConnectionHandler._next_delay(10)
+        delay2 = ConnectionHandler._next_delay(delay1)
+        delay3 = ConnectionHandler._next_delay(delay2)
 
         # Should increase exponentially
         assert delay1 == 15  # 10 * 1.5
@@ -1,9 +1,9 @@
 """Test the Pentair IntelliCenter integration initialization."""
 
-from unittest.mock import AsyncMock, MagicMock, call, patch
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 import pytest
@@ -16,7 +16,52 @@ from custom_components.intellicenter import (
     async_unload_entry,
 )
 
-pytestmark = pytest.mark.asyncio
+
+class MockConnectionHandler:
+    """Mock ConnectionHandler whose start reports success immediately."""
+
+    def __init__(self, controller, *args, **kwargs):
+        """Keep a reference to the controller like the real handler."""
+        self.controller = controller
+
+    async def start(self):
+        """Call the started callback to trigger platform setup."""
+        if hasattr(self, "started"):
+            self.started(self.controller)
+
+    def stop(self):
+        """Do nothing on stop."""
+
+    def reconnected(self, controller):
+        """Ignore reconnections."""
+
+    def updated(self, controller, updates):
+        """Ignore updates."""
+
+
+class FailingConnectionHandler(MockConnectionHandler):
+    """Mock ConnectionHandler whose start fails to connect."""
+
+    async def start(self):
+        """Raise as if the system were unreachable."""
+        raise ConnectionRefusedError
+
+
+@pytest.fixture
+def patched_controller_cls(monkeypatch) -> MagicMock:
+    """Patch ModelController for the test via a single setattr."""
+    cls = MagicMock()
+    monkeypatch.setattr("custom_components.intellicenter.ModelController", cls)
+    return cls
+
+
+@pytest.fixture
+def patched_handler_cls(monkeypatch) -> type[MockConnectionHandler]:
+    """Patch ConnectionHandler with the immediately-starting mock."""
+    monkeypatch.setattr(
+        "custom_components.intellicenter.ConnectionHandler", MockConnectionHandler
+    )
+    return MockConnectionHandler
 
 
 async def test_async_setup(hass: HomeAssistant) -> None:
@@ -26,108 +71,64 @@ async def test_async_setup(hass: HomeAssistant) -> None:
 
 
 async def test_async_setup_entry_success(
-    hass: HomeAssistant, mock_model_controller: MagicMock
+    hass: HomeAssistant,
+    mock_entry: SimpleNamespace,
+    patched_controller_cls: MagicMock,
+    patched_handler_cls: type[MockConnectionHandler],
 ) -> None:
     """Test successful setup of a config entry."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry_id"
-    entry.data = {CONF_HOST: "192.168.1.100"}
-
-    # Mock the handler's start method
-    with patch(
-        "custom_components.intellicenter.ModelController"
-    ) as mock_controller_class:
-        mock_controller = MagicMock()
-        mock_controller.systemInfo.propName = "Test Pool System"
-        mock_controller.model = MagicMock()
-        mock_controller.model.__iter__ = MagicMock(return_value=iter([]))
-        mock_controller_class.return_value = mock_controller
-
-        # Create a MockConnectionHandler class with async methods
-        class MockConnectionHandler:
-            """Mock ConnectionHandler for testing."""
-
-            def __init__(self, controller, *args, **kwargs):
-                self.controller = controller
-
-            async def start(self):
-                """Mock async start method that calls started callback."""
-                # Call the started callback to trigger platform setup
-                if hasattr(self, "started"):
-                    self.started(self.controller)
-
-            def stop(self):
-                """Mock stop method."""
-                pass
-
-            def reconnected(self, controller):
-                """Mock reconnected callback."""
-                pass
-
-            def updated(self, controller, updates):
-                """Mock updated callback."""
-                pass
-
-        with patch(
-            "custom_components.intellicenter.ConnectionHandler", MockConnectionHandler
-        ):
-            with patch.object(
-                hass.config_entries,
-                "async_forward_entry_setups",
-                new_callable=AsyncMock,
-            ) as mock_forward:
-                result = await async_setup_entry(hass, entry)
-
-                assert result is True
-                assert DOMAIN in hass.data
-                assert entry.entry_id in hass.data[DOMAIN]
-
-                # Wait a bit for the async task to complete
-                await hass.async_block_till_done()
-
-                # Verify platforms were set up
-                mock_forward.assert_called_once_with(entry, PLATFORMS)
-
-
-async def test_async_setup_entry_connection_failed(hass: HomeAssistant) -> None:
-    """Test setup fails when connection is refused."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry_id"
-    entry.data = {CONF_HOST: "192.168.1.100"}
+    entry = mock_entry
+
+    mock_controller = patched_controller_cls.return_value
+    mock_controller.systemInfo.propName = "Test Pool System"
+    # setup only iterates the model to log it; an empty tuple suffices
+    # and stays iterable however often it is walked
+    mock_controller.model = ()
+
+    with patch.object(
+        hass.config_entries,
+        "async_forward_entry_setups",
+        new_callable=AsyncMock,
+    ) as mock_forward:
+        result = await async_setup_entry(hass, entry)
 
-    with patch(
-        "custom_components.intellicenter.ModelController"
-    ) as mock_controller_class:
-        mock_controller = MagicMock()
-        mock_controller_class.return_value = mock_controller
+        assert result is True
+        assert DOMAIN in hass.data
+        assert entry.entry_id in hass.data[DOMAIN]
+
+        # yield once so the platform-setup task scheduled by
+        # started() can run; nothing else is pending
+        await asyncio.sleep(0)
 
-        # Create a MockConnectionHandler class that raises ConnectionRefusedError
-        class MockConnectionHandler:
-            """Mock ConnectionHandler that fails to connect."""
+        # Verify platforms were set up
+        mock_forward.assert_called_once_with(entry, PLATFORMS)
 
-            def __init__(self, controller, *args, **kwargs):
-                self.controller = controller
 
-            async def start(self):
-                """Mock async start that raises ConnectionRefusedError."""
-                raise ConnectionRefusedError()
+async def test_async_setup_entry_connection_failed(
+    hass: HomeAssistant,
+    mock_entry: SimpleNamespace,
+    patched_controller_cls: MagicMock,
+    monkeypatch,
+) -> None:
+    """Test setup fails when connection is refused."""
+    entry = mock_entry
 
-        with patch(
-            "custom_components.intellicenter.ConnectionHandler", MockConnectionHandler
-        ):
-            with pytest.raises(ConfigEntryNotReady):
-                await async_setup_entry(hass, entry)
+    monkeypatch.setattr(
+        "custom_components.intellicenter.ConnectionHandler",
+        FailingConnectionHandler,
+    )
+    with pytest.raises(ConfigEntryNotReady):
+        await async_setup_entry(hass, entry)
 
 
-async def test_async_unload_entry(hass: HomeAssistant) -> None:
+async def test_async_unload_entry(
+    hass: HomeAssistant, mock_entry: SimpleNamespace
+) -> None:
     """Test unloading a config entry."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry_id"
-    entry.data = {CONF_HOST: "192.168.1.100"}
+    entry = mock_entry
 
-    # Set up the handler in hass.data
-    mock_handler = MagicMock()
-    mock_handler.stop = MagicMock()
+    # Set up the handler in hass.data; unload only calls stop()
+    mock_handler = SimpleNamespace(stop=Mock())
     hass.data[DOMAIN] = {entry.entry_id: mock_handler}
 
     with patch.object(
@@ -137,10 +138,12 @@ async def test_async_unload_entry(hass: HomeAssistant) -> None:
     ) as mock_unload:
         result = await async_unload_entry(hass, entry)
 
-        # Verify all platforms were unloaded
+        # Verify all platforms were unloaded: one call into the mock
+        # internals, with the full diff reported on failure
         assert mock_unload.call_count == len(PLATFORMS)
-        for platform in PLATFORMS:
-            assert call(entry, platform) in mock_unload.call_args_list
+        mock_unload.assert_has_calls(
+            [call(entry, platform) for platform in PLATFORMS], any_order=True
+        )
 
         # Verify handler was stopped
         mock_handler.stop.assert_called_once()
@@ -151,13 +154,14 @@ async def test_async_unload_entry(hass: HomeAssistant) -> None:
         assert result is True
 
 
-async def test_async_unload_entry_platforms_fail(hass: HomeAssistant) -> None:
+async def test_async_unload_entry_platforms_fail(
+    hass: HomeAssistant, mock_entry: SimpleNamespace
+) -> None:
     """Test unload succeeds even when platforms fail to unload."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry_id"
+    entry = mock_entry
 
-    # Set up the handler in hass.data
-    mock_handler = MagicMock()
+    # Set up the handler in hass.data; unload only calls stop()
+    mock_handler = SimpleNamespace(stop=Mock())
     hass.data[DOMAIN] = {entry.entry_id: mock_handler}
 
     with patch.object(
@@ -1,15 +1,17 @@
 """Test the Pentair IntelliCenter light platform."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 from homeassistant.components.light import ATTR_EFFECT
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 import pytest
 
 from custom_components.intellicenter import DOMAIN
-from custom_components.intellicenter.light import LIGHTS_EFFECTS, PoolLight
+from custom_components.intellicenter.light import (
+    LIGHTS_EFFECTS,
+    PoolLight,
+    async_setup_entry,
+)
 from custom_components.intellicenter.pyintellicenter import (
     ACT_ATTR,
     STATUS_ATTR,
@@ -17,23 +19,54 @@ from custom_components.intellicenter.pyintellicenter import (
     PoolObject,
 )
 
-pytestmark = pytest.mark.asyncio
+# expected effect names, computed once from the shipped constant
+_EFFECT_NAMES = frozenset(LIGHTS_EFFECTS.values())
+
+
+@pytest.fixture(scope="module")
+def regular_light_obj() -> PoolObject:
+    """Return a regular light without color effect support.
+
+    Module-scoped: the one test using it only reads the object.
+    """
+    return PoolObject(
+        "LIGHT2",
+        {
+            "OBJTYP": "CIRCUIT",
+            "SUBTYP": "LIGHT",
+            "SNAME": "Regular Light",
+            "STATUS": "OFF",
+        },
+    )
+
+
+@pytest.fixture
+def pool_light(
+    mock_entry: SimpleNamespace,
+    recording_controller: SimpleNamespace,
+    pool_object_light: PoolObject,
+) -> PoolLight:
+    """Return a PoolLight wired to the shared entry, controller and object.
+
+    PoolLight reads its pool object live, so tests can mutate
+    pool_object_light after construction instead of rebuilding the
+    entity; building it once here amortizes HA's Entity wiring.
+    """
+    return PoolLight(
+        mock_entry, recording_controller, pool_object_light, LIGHTS_EFFECTS
+    )
 
 
 async def test_light_setup_creates_entities(
     hass: HomeAssistant,
+    mock_entry: SimpleNamespace,
     pool_model: PoolModel,
 ) -> None:
     """Test light platform creates entities for lights in the model."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-    entry.data = {CONF_HOST: "192.168.1.100"}
+    entry = mock_entry
 
-    # Mock the handler
-    mock_handler = MagicMock()
-    mock_controller = MagicMock()
-    mock_controller.model = pool_model
-    mock_handler.controller = mock_controller
+    # Only .controller.model is read during setup
+    mock_handler = SimpleNamespace(controller=SimpleNamespace(model=pool_model))
 
     hass.data[DOMAIN] = {entry.entry_id: mock_handler}
 
@@ -42,8 +75,6 @@ async def test_light_setup_creates_entities(
     def capture_entities(entities):
         entities_added.extend(entities)
 
-    from custom_components.intellicenter.light import async_setup_entry
-
     await async_setup_entry(hass, entry, capture_entities)
 
     # Should create entities for:
@@ -59,143 +90,59 @@ async def test_light_setup_creates_entities(
     assert "Party Show" in light_names
 
 
-async def test_light_entity_properties(
-    hass: HomeAssistant,
-    pool_object_light: PoolObject,
-) -> None:
+async def test_light_entity_properties(pool_light: PoolLight) -> None:
     """Test PoolLight entity properties."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-    mock_controller.requestChanges = AsyncMock()
-
-    light = PoolLight(entry, mock_controller, pool_object_light, LIGHTS_EFFECTS)
-
     # Test initial state
-    assert light.is_on is False
-    assert light.name == "Pool Light"
-    assert light.unique_id == "test_entry_LIGHT1"
-
-
-async def test_light_turn_on_basic(
-    hass: HomeAssistant,
-    pool_object_light: PoolObject,
+    assert pool_light.is_on is False
+    assert pool_light.name == "Pool Light"
+    assert pool_light.unique_id == "test_entry_LIGHT1"
+
+
+@pytest.mark.parametrize(
+    ("action", "kwargs", "expected"),
+    [
+        ("async_turn_on", {}, {STATUS_ATTR: "ON"}),
+        (
+            "async_turn_on",
+            {ATTR_EFFECT: "Party Mode"},
+            {STATUS_ATTR: "ON", ACT_ATTR: "PARTY"},
+        ),
+        ("async_turn_off", {}, {STATUS_ATTR: "OFF"}),
+    ],
+)
+async def test_light_actions(
+    pool_light: PoolLight,
+    recording_controller: SimpleNamespace,
+    action: str,
+    kwargs: dict,
+    expected: dict,
 ) -> None:
-    """Test turning on a light without effects."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-    mock_controller.requestChanges = AsyncMock()
-
-    light = PoolLight(entry, mock_controller, pool_object_light, LIGHTS_EFFECTS)
+    """Test turn_on/turn_off request the expected changes."""
+    await getattr(pool_light, action)(**kwargs)
 
-    await hass.async_block_till_done()
-    await light.async_turn_on()
-
-    # Should request status change to ON
-    mock_controller.requestChanges.assert_called_once()
-    args = mock_controller.requestChanges.call_args[0]
+    calls = recording_controller.requestChanges.calls
+    assert len(calls) == 1
+    args = calls[0][0]
     assert args[0] == "LIGHT1"
-    assert STATUS_ATTR in args[1]
-    assert args[1][STATUS_ATTR] == "ON"
+    assert args[1] == expected
 
 
-async def test_light_turn_on_with_effect(
-    hass: HomeAssistant,
-    pool_object_light: PoolObject,
-) -> None:
-    """Test turning on a light with color effect."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-    mock_controller.requestChanges = AsyncMock()
-
-    light = PoolLight(entry, mock_controller, pool_object_light, LIGHTS_EFFECTS)
-
-    await hass.async_block_till_done()
-    await light.async_turn_on(**{ATTR_EFFECT: "Party Mode"})
-
-    # Should request status ON and effect PARTY
-    mock_controller.requestChanges.assert_called_once()
-    args = mock_controller.requestChanges.call_args[0]
-    assert args[0] == "LIGHT1"
-    assert STATUS_ATTR in args[1]
-    assert args[1][STATUS_ATTR] == "ON"
-    assert ACT_ATTR in args[1]
-    assert args[1][ACT_ATTR] == "PARTY"
-
-
-async def test_light_turn_off(
-    hass: HomeAssistant,
-    pool_object_light: PoolObject,
-) -> None:
-    """Test turning off a light."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-    mock_controller.requestChanges = AsyncMock()
-
-    # Set light to ON initially
-    pool_object_light.update({STATUS_ATTR: "ON"})
-
-    light = PoolLight(entry, mock_controller, pool_object_light, LIGHTS_EFFECTS)
-
-    assert light.is_on is True
-
-    await hass.async_block_till_done()
-    await light.async_turn_off()
-
-    # Should request status change to OFF
-    mock_controller.requestChanges.assert_called_once()
-    args = mock_controller.requestChanges.call_args[0]
-    assert args[0] == "LIGHT1"
-    assert STATUS_ATTR in args[1]
-    assert args[1][STATUS_ATTR] == "OFF"
-
-
-async def test_light_supports_effects(
-    hass: HomeAssistant,
-    pool_object_light: PoolObject,
-) -> None:
+async def test_light_supports_effects(pool_light: PoolLight) -> None:
     """Test light with color effects support."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-
-    light = PoolLight(entry, mock_controller, pool_object_light, LIGHTS_EFFECTS)
-
-    # Should have effect list
-    assert light.effect_list is not None
-    assert len(light.effect_list) > 0
-    assert "Party Mode" in light.effect_list
-    assert "Caribbean" in light.effect_list
-    assert "White" in light.effect_list
+    # Should expose exactly the shipped effect names
+    assert pool_light.effect_list
+    assert set(pool_light.effect_list) == _EFFECT_NAMES
+    assert "Party Mode" in _EFFECT_NAMES
 
 
 async def test_light_no_effects_support(
-    hass: HomeAssistant,
+    mock_entry: SimpleNamespace,
+    regular_light_obj: PoolObject,
 ) -> None:
     """Test light without color effects support."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
+    entry = mock_entry
 
-    mock_controller = MagicMock()
-
-    # Create a regular light without color effect support
-    regular_light_obj = PoolObject(
-        "LIGHT2",
-        {
-            "OBJTYP": "CIRCUIT",
-            "SUBTYP": "LIGHT",
-            "SNAME": "Regular Light",
-            "STATUS": "OFF",
-        },
-    )
+    mock_controller = SimpleNamespace()
 
     light = PoolLight(entry, mock_controller, regular_light_obj, None)
 
@@ -204,35 +151,21 @@ async def test_light_no_effects_support(
 
 
 async def test_light_current_effect(
-    hass: HomeAssistant,
+    pool_light: PoolLight,
     pool_object_light: PoolObject,
 ) -> None:
     """Test getting current effect."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-
     # Set light to use PARTY effect
     pool_object_light.update({"USE": "PARTY"})
 
-    light = PoolLight(entry, mock_controller, pool_object_light, LIGHTS_EFFECTS)
-
-    assert light.effect == "Party Mode"
+    assert pool_light.effect == "Party Mode"
 
 
 async def test_light_state_updates(
-    hass: HomeAssistant,
+    pool_light: PoolLight,
     pool_object_light: PoolObject,
 ) -> None:
     """Test light state updates from IntelliCenter."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-
-    light = PoolLight(entry, mock_controller, pool_object_light, LIGHTS_EFFECTS)
-
     # Simulate update from IntelliCenter
     updates = {
         "LIGHT1": {
@@ -242,26 +175,25 @@ async def test_light_state_updates(
     }
 
     # Check if entity should be updated
-    assert light.isUpdated(updates) is True
+    assert pool_light.isUpdated(updates) is True
 
     # Apply the update
     pool_object_light.update(updates["LIGHT1"])
 
     # Verify state changed
-    assert light.is_on is True
-    assert light.effect == "Blue"
+    assert pool_light.is_on is True
+    assert pool_light.effect == "Blue"
 
 
 async def test_light_show_entity(
     hass: HomeAssistant,
+    mock_entry: SimpleNamespace,
     pool_model: PoolModel,
 ) -> None:
     """Test light show entity creation and properties."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
+    entry = mock_entry
 
-    mock_controller = MagicMock()
-    mock_controller.model = pool_model
+    mock_controller = SimpleNamespace(model=pool_model)
 
     show_obj = pool_model["SHOW1"]
 
@@ -282,45 +214,18 @@ async def test_light_show_entity(
     assert light_show.is_on is False
 
 
-async def test_light_is_not_updated_by_other_objects(
-    hass: HomeAssistant,
-    pool_object_light: PoolObject,
-) -> None:
-    """Test that light ignores updates to other objects."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-
-    light = PoolLight(entry, mock_controller, pool_object_light, LIGHTS_EFFECTS)
-
-    # Update for a different object
-    updates = {
-        "LIGHT2": {
-            STATUS_ATTR: "ON",
-        }
-    }
-
-    assert light.isUpdated(updates) is False
-
-
-async def test_light_is_not_updated_by_irrelevant_attributes(
-    hass: HomeAssistant,
-    pool_object_light: PoolObject,
+@pytest.mark.parametrize(
+    "updates",
+    [
+        # update for a different object
+        {"LIGHT2": {STATUS_ATTR: "ON"}},
+        # update with irrelevant attributes
+        {"LIGHT1": {"SOME_OTHER_ATTR": "value"}},
+    ],
+)
+async def test_light_is_not_updated(
+    pool_light: PoolLight,
+    updates: dict,
 ) -> None:
-    """Test that light ignores irrelevant attribute updates."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-
-    light = PoolLight(entry, mock_controller, pool_object_light, LIGHTS_EFFECTS)
-
-    # Update with irrelevant attributes
-    updates = {
-        "LIGHT1": {
-            "SOME_OTHER_ATTR": "value",
-        }
-    }
-
-    assert light.isUpdated(updates) is False
+    """Test that light ignores updates that don't concern it."""
+    assert pool_light.isUpdated(updates) is False
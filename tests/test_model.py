@@ -203,6 +203,16 @@ class TestPoolModel:
         assert spa[0].objnam == "SPA01"
         assert spa[0].subtype == "SPA"
 
+    def test_pool_model_get_by_type_tracks_type_change(self, pool_model: PoolModel):
+        """Test getByType reflects an OBJTYP change delivered in an update."""
+        pool_model.processUpdates(
+            [{"objnam": "CIRC01", "params": {OBJTYP_ATTR: BODY_TYPE}}]
+        )
+
+        # the object must move to its new type and leave the old one
+        assert any(obj.objnam == "CIRC01" for obj in pool_model.getByType(BODY_TYPE))
+        assert all(obj.objnam != "CIRC01" for obj in pool_model.getByType(CIRCUIT_TYPE))
+
     def test_pool_model_get_children(self, pool_model: PoolModel):
         """Test getting children of an object."""
         # Add a parent-child relationship
@@ -1,22 +1,46 @@
 """Tests for pyintellicenter protocol module."""
 
 import asyncio
+from contextlib import suppress
 import json
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pytest
 
+from custom_components.intellicenter.pyintellicenter import protocol as ic_protocol
 from custom_components.intellicenter.pyintellicenter.protocol import (
     CONNECTION_IDLE_TIMEOUT,
     FLOW_CONTROL_TIMEOUT,
-    HEARTBEAT_INTERVAL,
     ICProtocol,
 )
 
 
+async def _shutdown(protocol: ICProtocol) -> None:
+    """Close the protocol and await its heartbeat task deterministically."""
+    task = protocol._heartbeat_task
+    protocol.connection_lost(None)
+    if task is not None:
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    """Poll until predicate() holds, failing the test after timeout."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition never met"
+        await asyncio.sleep(0.01)
+
+
 class MockController:
     """Mock controller for testing protocol."""
 
+    __slots__ = (
+        "connection_made_called",
+        "connection_lost_called",
+        "received_messages",
+    )
+
     def __init__(self):
         """Initialize mock controller."""
         self.connection_made_called = False
@@ -62,9 +86,9 @@ class TestICProtocolInit:
         assert protocol._controller == mock_controller
         assert protocol._transport is None
         assert protocol._msgID == 1
-        assert protocol._lineBuffer == ""
+        assert protocol._lineBuffer == b""
         assert protocol._out_pending == 0
-        assert protocol._out_queue.empty()
+        assert not protocol._out_queue
         assert protocol._last_flow_control_activity is None
         assert protocol._last_data_received is None
         assert protocol._last_keepalive_sent is None
@@ -88,8 +112,7 @@ class TestICProtocolConnection:
         assert mock_controller.connection_made_called
 
         # Cleanup
-        protocol.connection_lost(None)
-        await asyncio.sleep(0.1)
+        await _shutdown(protocol)
 
     async def test_connection_lost(self, mock_controller, mock_transport):
         """Test connection_lost callback."""
@@ -98,11 +121,8 @@ class TestICProtocolConnection:
         # First establish connection
         protocol.connection_made(mock_transport)
 
-        # Then lose it
-        protocol.connection_lost(None)
-
-        # Wait for heartbeat task to be cancelled
-        await asyncio.sleep(0.1)
+        # Then lose it, awaiting the cancelled heartbeat task
+        await _shutdown(protocol)
 
         assert mock_controller.connection_lost_called
         assert protocol._heartbeat_task is None or protocol._heartbeat_task.done()
@@ -111,7 +131,9 @@ class TestICProtocolConnection:
 class TestICProtocolDataReceived:
     """Test ICProtocol data receiving."""
 
-    async def test_data_received_complete_message(self, mock_controller, mock_transport):
+    async def test_data_received_complete_message(
+        self, mock_controller, mock_transport
+    ):
         """Test receiving complete message."""
         protocol = ICProtocol(mock_controller)
         protocol.connection_made(mock_transport)
@@ -121,17 +143,18 @@ class TestICProtocolDataReceived:
         protocol.data_received((json.dumps(message) + "\r\n").encode())
 
         # Message should be processed
-        assert protocol._lineBuffer == ""
+        assert protocol._lineBuffer == b""
         assert len(mock_controller.received_messages) == 1
         assert mock_controller.received_messages[0][0] == "1"
         assert mock_controller.received_messages[0][1] == "Test"
         assert mock_controller.received_messages[0][2] == "200"
 
         # Cleanup
-        protocol.connection_lost(None)
-        await asyncio.sleep(0.1)
+        await _shutdown(protocol)
 
-    async def test_data_received_multiple_messages(self, mock_controller, mock_transport):
+    async def test_data_received_multiple_messages(
+        self, mock_controller, mock_transport
+    ):
         """Test receiving multiple messages in one chunk."""
         protocol = ICProtocol(mock_controller)
         protocol.connection_made(mock_transport)
@@ -146,8 +169,7 @@ class TestICProtocolDataReceived:
         assert len(mock_controller.received_messages) == 2
 
         # Cleanup
-        protocol.connection_lost(None)
-        await asyncio.sleep(0.1)
+        await _shutdown(protocol)
 
 
 class TestICProtocolProcessMessage:
@@ -161,7 +183,7 @@ class TestICProtocolProcessMessage:
         message = json.dumps(
             {"messageID": "1", "command": "Test", "response": "200", "data": "value"}
         )
-        protocol.processMessage(message)
+        protocol.processMessage(message.encode())
 
         assert len(mock_controller.received_messages) == 1
         msg_id, command, response, msg = mock_controller.received_messages[0]
@@ -171,8 +193,7 @@ class TestICProtocolProcessMessage:
         assert msg["data"] == "value"
 
         # Cleanup
-        protocol.connection_lost(None)
-        await asyncio.sleep(0.1)
+        await _shutdown(protocol)
 
     async def test_processMessage_notification(self, mock_controller, mock_transport):
         """Test processing notification (no response field)."""
@@ -180,7 +201,7 @@ class TestICProtocolProcessMessage:
         protocol.connection_made(mock_transport)
 
         message = json.dumps({"messageID": "1", "command": "NotifyList"})
-        protocol.processMessage(message)
+        protocol.processMessage(message.encode())
 
         assert len(mock_controller.received_messages) == 1
         msg_id, command, response, msg = mock_controller.received_messages[0]
@@ -189,8 +210,153 @@ class TestICProtocolProcessMessage:
         assert response is None
 
         # Cleanup
-        protocol.connection_lost(None)
-        await asyncio.sleep(0.1)
+        await _shutdown(protocol)
+
+
+class TestICProtocolFlowControl:
+    """Test the default one-request-on-the-wire flow control."""
+
+    async def test_send_request_written_on_flush(self, mock_controller, mock_transport):
+        """Test a lone request is written once the scheduled flush runs."""
+        protocol = ICProtocol(mock_controller)
+        protocol.connection_made(mock_transport)
+
+        protocol.sendRequest(b"req1")
+        # the write is deferred to the end of the event loop iteration
+        assert not mock_transport.writelines.called
+
+        await asyncio.sleep(0)
+        assert mock_transport.writelines.call_args_list == [call([b"req1"])]
+        assert protocol._out_pending == 1
+
+        await _shutdown(protocol)
+
+    async def test_second_request_waits_for_response(
+        self, mock_controller, mock_transport
+    ):
+        """Test a request issued while one is pending waits for its response."""
+        protocol = ICProtocol(mock_controller)
+        protocol.connection_made(mock_transport)
+
+        protocol.sendRequest(b"req1")
+        await asyncio.sleep(0)
+        protocol.sendRequest(b"req2")
+        await asyncio.sleep(0)
+
+        # req1 is still unanswered, so req2 must stay queued
+        assert mock_transport.writelines.call_args_list == [call([b"req1"])]
+        assert list(protocol._out_queue) == [b"req2"]
+
+        # the response releases exactly the next queued request
+        protocol.responseReceived()
+        assert mock_transport.writelines.call_args_list == [
+            call([b"req1"]),
+            call([b"req2"]),
+        ]
+        assert not protocol._out_queue
+
+        await _shutdown(protocol)
+
+    async def test_out_pending_bookkeeping(self, mock_controller, mock_transport):
+        """Test _out_pending tracks queued and on-wire requests across the drain."""
+        protocol = ICProtocol(mock_controller)
+        protocol.connection_made(mock_transport)
+
+        protocol.sendRequest(b"req1")
+        protocol.sendRequest(b"req2")
+        await asyncio.sleep(0)
+        assert protocol._out_pending == 2
+
+        protocol.responseReceived()  # settles req1, sends req2
+        assert protocol._out_pending == 1
+        assert not protocol._out_queue
+
+        protocol.responseReceived()  # settles req2
+        assert protocol._out_pending == 0
+
+        await _shutdown(protocol)
+
+    async def test_queued_requests_dropped_after_connection_lost(
+        self, mock_controller, mock_transport
+    ):
+        """Test a flush after connection loss drops queued requests quietly."""
+        protocol = ICProtocol(mock_controller)
+        protocol.connection_made(mock_transport)
+
+        protocol.sendRequest(b"req1")
+        # the connection goes away before the scheduled flush runs
+        await _shutdown(protocol)
+
+        # the flush must no-op rather than write to (or crash on) the
+        # closed transport
+        await asyncio.sleep(0)
+        assert not mock_transport.writelines.called
+
+
+class TestICProtocolFlowControlKnobs:
+    """Test the max_in_flight and coalesce_delay tuning knobs."""
+
+    async def test_max_in_flight_fills_free_budget(
+        self, mock_controller, mock_transport
+    ):
+        """Test a request sent while the budget has room goes out immediately."""
+        protocol = ICProtocol(mock_controller, max_in_flight=2)
+        protocol.connection_made(mock_transport)
+
+        protocol.sendRequest(b"req1")
+        await asyncio.sleep(0)  # run the scheduled flush
+        assert mock_transport.writelines.call_args_list == [call([b"req1"])]
+
+        # req1 is in flight but the budget of 2 still has room, so req2
+        # must be written without waiting for req1's response
+        protocol.sendRequest(b"req2")
+        await asyncio.sleep(0)
+        assert mock_transport.writelines.call_args_list == [
+            call([b"req1"]),
+            call([b"req2"]),
+        ]
+        assert not protocol._out_queue
+
+        await _shutdown(protocol)
+
+    async def test_max_in_flight_bounds_a_burst(self, mock_controller, mock_transport):
+        """Test a burst beyond the budget is queued until responses settle."""
+        protocol = ICProtocol(mock_controller, max_in_flight=2)
+        protocol.connection_made(mock_transport)
+
+        protocol.sendRequest(b"req1")
+        protocol.sendRequest(b"req2")
+        protocol.sendRequest(b"req3")
+        await asyncio.sleep(0)
+
+        # the flush sends the budget's worth in one write; req3 waits
+        assert mock_transport.writelines.call_args_list == [call([b"req1", b"req2"])]
+        assert list(protocol._out_queue) == [b"req3"]
+
+        protocol.responseReceived()
+        assert mock_transport.writelines.call_args_list[-1] == call([b"req3"])
+        assert not protocol._out_queue
+
+        await _shutdown(protocol)
+
+    async def test_coalesce_delay_batches_the_burst(
+        self, mock_controller, mock_transport
+    ):
+        """Test coalesce_delay holds the first write so later requests join it."""
+        protocol = ICProtocol(mock_controller, max_in_flight=2, coalesce_delay=0.02)
+        protocol.connection_made(mock_transport)
+
+        protocol.sendRequest(b"req1")
+        await asyncio.sleep(0)
+        # the write is held for the coalescing window
+        assert not mock_transport.writelines.called
+
+        # a request issued inside the window rides the same flush
+        protocol.sendRequest(b"req2")
+        await _wait_for(lambda: mock_transport.writelines.called)
+        assert mock_transport.writelines.call_args_list == [call([b"req1", b"req2"])]
+
+        await _shutdown(protocol)
 
 
 class TestICProtocolHeartbeat:
@@ -205,11 +371,17 @@ class TestICProtocolHeartbeat:
         assert not protocol._heartbeat_task.done()
 
         # Cleanup
-        protocol.connection_lost(None)
-        await asyncio.sleep(0.1)
+        await _shutdown(protocol)
 
-    async def test_heartbeat_detects_idle_timeout(self, mock_controller, mock_transport):
+    async def test_heartbeat_detects_idle_timeout(
+        self, mock_controller, mock_transport, monkeypatch
+    ):
         """Test heartbeat detects idle connection."""
+        # shrink the heartbeat cadence so the check fires in milliseconds
+        # of wall clock instead of a full HEARTBEAT_INTERVAL
+        monkeypatch.setattr(ic_protocol, "HEARTBEAT_INTERVAL", 0.05)
+        monkeypatch.setattr(ic_protocol, "HEARTBEAT_MIN_INTERVAL", 0)
+
         protocol = ICProtocol(mock_controller)
         protocol.connection_made(mock_transport)
 
@@ -219,41 +391,38 @@ class TestICProtocolHeartbeat:
         )
 
         # Wait for heartbeat to detect timeout
-        await asyncio.sleep(HEARTBEAT_INTERVAL + 1)
-
-        # Connection should be closed
-        mock_transport.close.assert_called()
-
-        # Cleanup
-        await asyncio.sleep(0.1)
+        await _wait_for(lambda: mock_transport.close.called)
 
     async def test_heartbeat_detects_flow_control_deadlock(
-        self, mock_controller, mock_transport
+        self, mock_controller, mock_transport, monkeypatch
     ):
         """Test heartbeat detects and resets flow control deadlock."""
+        monkeypatch.setattr(ic_protocol, "HEARTBEAT_INTERVAL", 0.05)
+        monkeypatch.setattr(ic_protocol, "HEARTBEAT_MIN_INTERVAL", 0)
+
         protocol = ICProtocol(mock_controller)
         protocol.connection_made(mock_transport)
 
         # Simulate deadlock: pending requests with no activity
         protocol._out_pending = 5
-        protocol._out_queue.put("queued1")
-        protocol._out_queue.put("queued2")
+        protocol._out_queue.append(b"queued1")
+        protocol._out_queue.append(b"queued2")
         protocol._last_flow_control_activity = asyncio.get_event_loop().time() - (
             FLOW_CONTROL_TIMEOUT + 10
         )
 
         # Wait for heartbeat to detect deadlock
-        await asyncio.sleep(HEARTBEAT_INTERVAL + 1)
+        await _wait_for(lambda: protocol._out_pending == 0)
 
         # Flow control should be reset
-        assert protocol._out_pending == 0
-        assert protocol._out_queue.empty()
+        assert not protocol._out_queue
 
         # Cleanup
-        protocol.connection_lost(None)
-        await asyncio.sleep(0.1)
+        await _shutdown(protocol)
 
-    async def test_heartbeat_cancelled_on_disconnect(self, mock_controller, mock_transport):
+    async def test_heartbeat_cancelled_on_disconnect(
+        self, mock_controller, mock_transport
+    ):
         """Test heartbeat task is cancelled on disconnect."""
         protocol = ICProtocol(mock_controller)
         protocol.connection_made(mock_transport)
@@ -261,8 +430,7 @@ class TestICProtocolHeartbeat:
         heartbeat_task = protocol._heartbeat_task
         assert not heartbeat_task.done()
 
-        protocol.connection_lost(None)
-        await asyncio.sleep(0.1)
+        await _shutdown(protocol)
 
         # Task should be cancelled
         assert heartbeat_task.cancelled() or heartbeat_task.done()
@@ -5,12 +5,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
-import pytest
 
 from custom_components.intellicenter import DOMAIN
 
-pytestmark = pytest.mark.asyncio
-
 
 async def test_sensor_setup(hass: HomeAssistant) -> None:
     """Test sensor platform setup."""
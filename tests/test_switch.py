@@ -1,9 +1,8 @@
 """Test the Pentair IntelliCenter switch platform."""
 
-from unittest.mock import AsyncMock, MagicMock
+from collections import Counter
+from types import SimpleNamespace
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 import pytest
 
@@ -14,62 +13,57 @@ from custom_components.intellicenter.pyintellicenter import (
     PoolModel,
     PoolObject,
 )
-from custom_components.intellicenter.switch import PoolBody, PoolCircuit
-
-pytestmark = pytest.mark.asyncio
+from custom_components.intellicenter.switch import (
+    PoolBody,
+    PoolCircuit,
+    async_setup_entry,
+)
 
 
-async def test_switch_setup_creates_entities(
+@pytest.fixture
+async def switch_entities(
     hass: HomeAssistant,
+    mock_entry: SimpleNamespace,
     pool_model: PoolModel,
-) -> None:
-    """Test switch platform creates entities for circuits and bodies."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-    entry.data = {CONF_HOST: "192.168.1.100"}
+) -> list:
+    """Run the switch platform setup once and return the entities added.
 
-    mock_handler = MagicMock()
-    mock_controller = MagicMock()
-    mock_controller.model = pool_model
-    mock_handler.controller = mock_controller
+    Both setup tests consume this list instead of each driving their
+    own handler wiring and async_setup_entry call. (It cannot be
+    module-scoped: it depends on the function-scoped hass fixture.)
+    """
+    mock_handler = SimpleNamespace(controller=SimpleNamespace(model=pool_model))
+    hass.data[DOMAIN] = {mock_entry.entry_id: mock_handler}
 
-    hass.data[DOMAIN] = {entry.entry_id: mock_handler}
+    entities_added: list = []
+    await async_setup_entry(hass, mock_entry, entities_added.extend)
+    return entities_added
 
-    entities_added = []
-
-    def capture_entities(entities):
-        entities_added.extend(entities)
-
-    from custom_components.intellicenter.switch import async_setup_entry
-
-    await async_setup_entry(hass, entry, capture_entities)
 
+async def test_switch_setup_creates_entities(switch_entities: list) -> None:
+    """Test switch platform creates entities for circuits and bodies."""
     # Should create switches for:
     # - POOL1 (Pool body)
     # - SPA01 (Spa body)
     # - CIRC01 (Featured circuit - Pool Cleaner)
     # - SYS01 (Vacation mode)
-    assert len(entities_added) >= 4
+    assert len(switch_entities) >= 4
 
-    # Verify we have body switches
-    body_switches = [e for e in entities_added if isinstance(e, PoolBody)]
-    assert len(body_switches) == 2
+    # One pass over the entities covers both type counts; PoolBody
+    # subclasses PoolCircuit, so count exact types and combine
+    counts = Counter(type(e) for e in switch_entities)
+    assert counts[PoolBody] == 2
+    assert counts[PoolBody] + counts[PoolCircuit] >= 2
 
-    # Verify we have circuit switches
-    circuit_switches = [e for e in entities_added if isinstance(e, PoolCircuit)]
-    assert len(circuit_switches) >= 2
 
-
-async def test_circuit_switch_properties(
-    hass: HomeAssistant,
+def test_circuit_switch_properties(
+    mock_entry: SimpleNamespace,
+    recording_controller: SimpleNamespace,
     pool_object_switch: PoolObject,
 ) -> None:
     """Test PoolCircuit switch properties."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-    mock_controller.requestChanges = AsyncMock()
+    entry = mock_entry
+    mock_controller = recording_controller
 
     switch = PoolCircuit(entry, mock_controller, pool_object_switch)
 
@@ -78,66 +72,37 @@ async def test_circuit_switch_properties(
     assert switch.unique_id == "test_entry_CIRC01"
 
 
-async def test_circuit_switch_turn_on(
-    hass: HomeAssistant,
-    pool_object_switch: PoolObject,
-) -> None:
-    """Test turning on a circuit switch."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-    mock_controller.requestChanges = AsyncMock()
-
-    switch = PoolCircuit(entry, mock_controller, pool_object_switch)
-
-    await hass.async_block_till_done()
-    await switch.async_turn_on()
-
-    mock_controller.requestChanges.assert_called_once()
-    args = mock_controller.requestChanges.call_args[0]
-    assert args[0] == "CIRC01"
-    assert STATUS_ATTR in args[1]
-    assert args[1][STATUS_ATTR] == "ON"
-
-
-async def test_circuit_switch_turn_off(
-    hass: HomeAssistant,
+@pytest.mark.parametrize(
+    ("method", "expected_status"),
+    [("async_turn_on", "ON"), ("async_turn_off", "OFF")],
+)
+async def test_circuit_switch_toggle(
+    mock_entry: SimpleNamespace,
+    recording_controller: SimpleNamespace,
     pool_object_switch: PoolObject,
+    method: str,
+    expected_status: str,
 ) -> None:
-    """Test turning off a circuit switch."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
+    """Test toggling a circuit switch requests the expected status."""
+    switch = PoolCircuit(mock_entry, recording_controller, pool_object_switch)
 
-    mock_controller = MagicMock()
-    mock_controller.requestChanges = AsyncMock()
+    await getattr(switch, method)()
 
-    # Set switch to ON initially
-    pool_object_switch.update({STATUS_ATTR: "ON"})
-
-    switch = PoolCircuit(entry, mock_controller, pool_object_switch)
-
-    assert switch.is_on is True
-
-    await hass.async_block_till_done()
-    await switch.async_turn_off()
-
-    mock_controller.requestChanges.assert_called_once()
-    args = mock_controller.requestChanges.call_args[0]
+    calls = recording_controller.requestChanges.calls
+    assert len(calls) == 1
+    args = calls[0][0]
     assert args[0] == "CIRC01"
-    assert STATUS_ATTR in args[1]
-    assert args[1][STATUS_ATTR] == "OFF"
+    assert args[1][STATUS_ATTR] == expected_status
 
 
-async def test_body_switch_properties(
-    hass: HomeAssistant,
+def test_body_switch_properties(
+    mock_entry: SimpleNamespace,
+    recording_controller: SimpleNamespace,
     pool_object_body: PoolObject,
 ) -> None:
     """Test PoolBody switch properties."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
+    entry = mock_entry
+    mock_controller = recording_controller
 
     body_switch = PoolBody(entry, mock_controller, pool_object_body)
 
@@ -146,64 +111,37 @@ async def test_body_switch_properties(
     assert body_switch.unique_id == "test_entry_POOL1"
 
 
-async def test_body_switch_turn_on(
-    hass: HomeAssistant,
-    pool_object_body: PoolObject,
-) -> None:
-    """Test turning on a body switch."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-    mock_controller.requestChanges = AsyncMock()
-
-    # Set body to OFF initially
-    pool_object_body.update({STATUS_ATTR: "OFF"})
-
-    body_switch = PoolBody(entry, mock_controller, pool_object_body)
-
-    await hass.async_block_till_done()
-    await body_switch.async_turn_on()
-
-    mock_controller.requestChanges.assert_called_once()
-    args = mock_controller.requestChanges.call_args[0]
-    assert args[0] == "POOL1"
-    assert STATUS_ATTR in args[1]
-    assert args[1][STATUS_ATTR] == "ON"
-
-
-async def test_body_switch_turn_off(
-    hass: HomeAssistant,
+@pytest.mark.parametrize(
+    ("method", "expected_status"),
+    [("async_turn_on", "ON"), ("async_turn_off", "OFF")],
+)
+async def test_body_switch_toggle(
+    mock_entry: SimpleNamespace,
+    recording_controller: SimpleNamespace,
     pool_object_body: PoolObject,
+    method: str,
+    expected_status: str,
 ) -> None:
-    """Test turning off a body switch."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
-    mock_controller.requestChanges = AsyncMock()
-
-    body_switch = PoolBody(entry, mock_controller, pool_object_body)
+    """Test toggling a body switch requests the expected status."""
+    body_switch = PoolBody(mock_entry, recording_controller, pool_object_body)
 
-    await hass.async_block_till_done()
-    await body_switch.async_turn_off()
+    await getattr(body_switch, method)()
 
-    mock_controller.requestChanges.assert_called_once()
-    args = mock_controller.requestChanges.call_args[0]
+    calls = recording_controller.requestChanges.calls
+    assert len(calls) == 1
+    args = calls[0][0]
     assert args[0] == "POOL1"
-    assert STATUS_ATTR in args[1]
-    assert args[1][STATUS_ATTR] == "OFF"
+    assert args[1][STATUS_ATTR] == expected_status
 
 
-async def test_vacation_mode_switch(
-    hass: HomeAssistant,
+def test_vacation_mode_switch(
+    mock_entry: SimpleNamespace,
+    recording_controller: SimpleNamespace,
     pool_model: PoolModel,
 ) -> None:
     """Test vacation mode switch creation and properties."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
+    entry = mock_entry
+    mock_controller = recording_controller
 
     system_obj = pool_model["SYS01"]
     system_obj.update({VACFLO_ATTR: "OFF"})
@@ -223,15 +161,14 @@ async def test_vacation_mode_switch(
     assert vacation_switch.entity_registry_enabled_default is False
 
 
-async def test_switch_state_updates(
-    hass: HomeAssistant,
+def test_switch_state_updates(
+    mock_entry: SimpleNamespace,
+    recording_controller: SimpleNamespace,
     pool_object_switch: PoolObject,
 ) -> None:
     """Test switch state updates from IntelliCenter."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_controller = MagicMock()
+    entry = mock_entry
+    mock_controller = recording_controller
 
     switch = PoolCircuit(entry, mock_controller, pool_object_switch)
 
@@ -251,34 +188,11 @@ async def test_switch_state_updates(
     assert switch.is_on is True
 
 
-async def test_non_featured_circuit_not_created(
-    hass: HomeAssistant,
-    pool_model: PoolModel,
-) -> None:
+async def test_non_featured_circuit_not_created(switch_entities: list) -> None:
     """Test that non-featured circuits don't create switches."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry"
-
-    mock_handler = MagicMock()
-    mock_controller = MagicMock()
-    mock_controller.model = pool_model
-    mock_handler.controller = mock_controller
-
-    hass.data[DOMAIN] = {entry.entry_id: mock_handler}
-
-    entities_added = []
-
-    def capture_entities(entities):
-        entities_added.extend(entities)
-
-    from custom_components.intellicenter.switch import async_setup_entry
-
-    await async_setup_entry(hass, entry, capture_entities)
-
-    # CIRC02 is not featured, should not be in switches
-    circ02_switches = [
-        e
-        for e in entities_added
-        if hasattr(e, "_poolObject") and e._poolObject.objnam == "CIRC02"
-    ]
-    assert len(circ02_switches) == 0
+    # CIRC02 is not featured, should not be in switches; any() short-
+    # circuits instead of materializing a throwaway list
+    assert not any(
+        getattr(e, "_poolObject", None) and e._poolObject.objnam == "CIRC02"
+        for e in switch_entities
+    )